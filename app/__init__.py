@@ -4,12 +4,14 @@ from flask import Flask
 from flask_cors import CORS
 from dotenv import load_dotenv
 
-from data.db import engine
-from .models import Base
-from .routes import register_routes
-
+# Before the package imports below: route modules read settings such as the admin token at import.
 load_dotenv()
 
+from data.db import engine  # noqa: E402
+from .json_provider import OrjsonProvider  # noqa: E402
+from .models import Base  # noqa: E402
+from .routes import register_routes  # noqa: E402
+
 
 def _get_cors_origins():
     raw = os.getenv("CORS_ALLOWED_ORIGINS", "*").strip()
@@ -23,6 +25,7 @@ def _get_cors_origins():
 def create_app() -> Flask:
     """Application factory that wires up extensions, routes, and database."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     cors_origins = _get_cors_origins()
     if cors_origins == "*":
         CORS(app)
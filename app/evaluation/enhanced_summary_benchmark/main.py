@@ -7,7 +7,7 @@ from dotenv import load_dotenv
 from typing import List
 
 from src.dataset import GOLD_STANDARD_DATASET
-from src.models import get_client
+from src.models import CachedLLMClient, LLMClient, ResponseCache, get_client, openai_embedder
 from src.pipelines import (
     BasicPipeline,
     EnhancedPipeline,
@@ -56,12 +56,19 @@ def _normalize_inverse(values: List[float]) -> List[float]:
     return [1 - ((val - min_v) / (max_v - min_v)) for val in values]
 
 
-async def run_experiment(models: list, approaches: list, dataset: list):
+async def run_experiment(models: list, approaches: list, dataset: list, cache_policy: str = "off"):
     results_data = []
     metrics_engine = MetricsEngine()
+    response_cache = ResponseCache(embed_fn=openai_embedder() if cache_policy == "semantic" else None)
+
+    def make_client(model_name: str) -> LLMClient:
+        client = get_client(model_name)
+        if cache_policy == "off":
+            return client
+        return CachedLLMClient(client, response_cache, default_policy=cache_policy)
 
     # Judge model for Approach 4 (Hardcoded to a strong model or same model)
-    judge_model = get_client("gpt-4o")
+    judge_model = make_client("gpt-4o")
 
     async def _evaluate_pipeline(pipeline, article_id, topic, article, reference, model_name, approach_label):
         print(f"Spúšťam model {model_name} / prístup {approach_label} pre článok {article_id}...")
@@ -125,7 +132,7 @@ async def run_experiment(models: list, approaches: list, dataset: list):
 
         for model_name in models:
             print(f"\n--- Testujem model: {model_name} ---")
-            client = get_client(model_name)
+            client = make_client(model_name)
 
             pipelines_map = {
                 "1": BasicPipeline(client, metrics_engine),
@@ -135,10 +142,10 @@ async def run_experiment(models: list, approaches: list, dataset: list):
             }
 
             if "5" in approaches:
-                mam_detectors = [get_client(name) for name in MAM_REFINE_MODEL_CONFIG["detectors"]]
-                mam_critiques = [get_client(name) for name in MAM_REFINE_MODEL_CONFIG["critique"]]
-                mam_refiners = [get_client(name) for name in MAM_REFINE_MODEL_CONFIG["refine"]]
-                mam_rerank = get_client(MAM_REFINE_MODEL_CONFIG["rerank"])
+                mam_detectors = [make_client(name) for name in MAM_REFINE_MODEL_CONFIG["detectors"]]
+                mam_critiques = [make_client(name) for name in MAM_REFINE_MODEL_CONFIG["critique"]]
+                mam_refiners = [make_client(name) for name in MAM_REFINE_MODEL_CONFIG["refine"]]
+                mam_rerank = make_client(MAM_REFINE_MODEL_CONFIG["rerank"])
                 pipelines_map["5"] = MamRefinePipeline(
                     baseline_model=client,
                     detector_models=mam_detectors,
@@ -297,6 +304,8 @@ async def run_experiment(models: list, approaches: list, dataset: list):
         f"\nHotovo! Kompletný report: {full_filename}\n"
         f"Sprievodný prehľad metrik: {summary_filename}"
     )
+    if cache_policy != "off":
+        print(f"Cache odpovedí: {response_cache.hits} zásahov, {response_cache.misses} volaní API")
     if best_combination:
         print(
             f"Najefektívnejšia kombinácia: {best_combination['model']} / {best_combination['approach']} "
@@ -308,6 +317,12 @@ def main():
     parser = argparse.ArgumentParser(description="LLM Slovak Summarization Evaluator")
     parser.add_argument("--models", type=str, required=True, help="Comma-separated models (e.g. gpt-4o,gemini-1.5-flash)")
     parser.add_argument("--approaches", type=str, default="1,2,3,4", help="Comma-separated approach IDs (1-5)")
+    parser.add_argument(
+        "--cache",
+        choices=["off", "exact", "semantic"],
+        default="off",
+        help="Reuse LLM responses for repeated (exact) or near-duplicate (semantic) prompts",
+    )
 
     args = parser.parse_args()
 
@@ -322,7 +337,7 @@ def main():
     except LookupError:
         nltk.download('punkt', quiet=True)
 
-    asyncio.run(run_experiment(model_list, approach_list, GOLD_STANDARD_DATASET))
+    asyncio.run(run_experiment(model_list, approach_list, GOLD_STANDARD_DATASET, cache_policy=args.cache))
 
 
 if __name__ == "__main__":
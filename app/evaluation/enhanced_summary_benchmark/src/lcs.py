@@ -0,0 +1,64 @@
+"""Longest common subsequence length for ROUGE-L, JIT-compiled with Numba when available."""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; lcs_length then uses the bit-parallel pure-Python kernel.
+    njit = None
+
+
+def _token_ids(a: Sequence[str], b: Sequence[str]) -> Tuple[List[int], List[int]]:
+    ids: Dict[str, int] = {}
+    return [ids.setdefault(t, len(ids)) for t in a], [ids.setdefault(t, len(ids)) for t in b]
+
+
+def _lcs_bitparallel(a: Sequence[int], b: Sequence[int]) -> int:
+    # Hyyrö's bit-parallel LCS; Python ints hold one bit per token of `b` at any length.
+    matches: Dict[int, int] = {}
+    for j, token_id in enumerate(b):
+        matches[token_id] = matches.get(token_id, 0) | (1 << j)
+    full = (1 << len(b)) - 1
+    v = full
+    for token_id in a:
+        u = v & matches.get(token_id, 0)
+        v = ((v + u) | (v - u)) & full
+    return len(b) - v.bit_count()
+
+
+if njit is not None:
+
+    @njit(cache=True, nogil=True)
+    def _lcs_rows(a: np.ndarray, b: np.ndarray) -> int:
+        # Two rolling rows over the shorter sequence, so the DP state stays in L1.
+        if b.shape[0] > a.shape[0]:
+            a, b = b, a
+        m = b.shape[0]
+        prev = np.zeros(m + 1, dtype=np.int64)
+        curr = np.zeros(m + 1, dtype=np.int64)
+        for i in range(a.shape[0]):
+            ai = a[i]
+            for j in range(m):
+                if ai == b[j]:
+                    curr[j + 1] = prev[j] + 1
+                elif prev[j + 1] >= curr[j]:
+                    curr[j + 1] = prev[j + 1]
+                else:
+                    curr[j + 1] = curr[j]
+            prev, curr = curr, prev
+        return prev[m]
+
+else:
+    _lcs_rows = None
+
+
+def lcs_length(a: Sequence[str], b: Sequence[str]) -> int:
+    if not a or not b:
+        return 0
+    a_ids, b_ids = _token_ids(a, b)
+    if _lcs_rows is not None:
+        return int(_lcs_rows(np.asarray(a_ids, dtype=np.int32), np.asarray(b_ids, dtype=np.int32)))
+    return _lcs_bitparallel(a_ids, b_ids)
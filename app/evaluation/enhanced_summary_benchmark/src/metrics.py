@@ -1,13 +1,17 @@
 import time
-from typing import Tuple
+from collections import Counter
+from typing import List, Tuple
 from nltk.translate.bleu_score import sentence_bleu, SmoothingFunction
-from rouge_score import rouge_scorer
+from rouge_score import scoring, tokenizers
 from bert_score import score as bert_score
+from src.lcs import lcs_length
 from src.types import TokenUsage, MetricResult
 
 class MetricsEngine:
     def __init__(self, bert_model_type: str = "bert-base-multilingual-cased", bert_lang: str = "sk"):
-        self.rouge = rouge_scorer.RougeScorer(['rouge1', 'rougeL'], use_stemmer=True)
+        # Same tokenization as rouge_scorer.RougeScorer(['rouge1', 'rougeL'], use_stemmer=True);
+        # ROUGE-L uses the compiled LCS kernel instead of rouge-score's Python DP table.
+        self.rouge_tokenizer = tokenizers.DefaultTokenizer(use_stemmer=True)
         self.smooth = SmoothingFunction().method1
         self.bert_model_type = bert_model_type
         self.bert_lang = bert_lang
@@ -24,15 +28,15 @@ class MetricsEngine:
         bleu = sentence_bleu([ref_tokens], hyp_tokens, smoothing_function=self.smooth)
 
         # ROUGE
-        scores = self.rouge.score(reference, hypothesis)
+        rouge_1, rouge_l = self._calculate_rouge(reference, hypothesis)
 
         # BERTScore (multilingual)
         bert_p, bert_r, bert_f1 = self._calculate_bertscore(reference, hypothesis)
         
         return MetricResult(
             bleu=round(bleu, 4),
-            rouge_1=round(scores['rouge1'].fmeasure, 4),
-            rouge_l=round(scores['rougeL'].fmeasure, 4),
+            rouge_1=round(rouge_1, 4),
+            rouge_l=round(rouge_l, 4),
             bert_precision=bert_p,
             bert_recall=bert_r,
             bert_f1=bert_f1,
@@ -40,6 +44,27 @@ class MetricsEngine:
             latencies=latencies
         )
 
+    def _calculate_rouge(self, reference: str, hypothesis: str) -> Tuple[float, float]:
+        """ROUGE-1 and ROUGE-L F-measures, matching rouge-score's definitions."""
+        target = self.rouge_tokenizer.tokenize(reference)
+        prediction = self.rouge_tokenizer.tokenize(hypothesis)
+        return self._rouge_1(target, prediction), self._rouge_l(target, prediction)
+
+    @staticmethod
+    def _rouge_1(target: List[str], prediction: List[str]) -> float:
+        target_counts, prediction_counts = Counter(target), Counter(prediction)
+        overlap = sum(min(count, prediction_counts[token]) for token, count in target_counts.items())
+        precision = overlap / max(len(prediction), 1)
+        recall = overlap / max(len(target), 1)
+        return scoring.fmeasure(precision, recall)
+
+    @staticmethod
+    def _rouge_l(target: List[str], prediction: List[str]) -> float:
+        if not target or not prediction:
+            return 0.0
+        lcs = lcs_length(target, prediction)
+        return scoring.fmeasure(lcs / len(prediction), lcs / len(target))
+
     def _calculate_bertscore(self, reference: str, hypothesis: str) -> Tuple[float, float, float]:
         try:
             P, R, F1 = bert_score(
@@ -2,11 +2,25 @@ import abc
 import os
 import time
 import asyncio
-from typing import List, Optional
+from functools import lru_cache
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
 import openai
 import google.generativeai as genai
+from src.prompts import MammRefinePrompts
 from src.types import LLMResponse, TokenUsage
 
+CachePolicy = str  # "exact" | "semantic" | "off"
+EmbedFn = Callable[[str], Awaitable[Sequence[float]]]
+
+# Judge prompts differ only in a sentence or in the candidate order, so a
+# near-duplicate match would return the wrong verdict; these stay exact-only.
+EXACT_ONLY_SYSTEM_PROMPTS = frozenset({
+    MammRefinePrompts.DETECT_SYSTEM,
+    MammRefinePrompts.CRITIQUE_RERANK_SYSTEM,
+    MammRefinePrompts.SUMMARY_RERANK_SYSTEM,
+})
+
 class LLMClient(abc.ABC):
     def __init__(self, model_name: str):
         self.model_name = model_name
@@ -21,6 +35,22 @@ class LLMClient(abc.ABC):
     ) -> LLMResponse:
         pass
 
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        assistant_prompt: Optional[str] = None,
+        usage: Optional[TokenUsage] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Yields the completion in chunks. Provider-reported usage is added to `usage`
+        when the stream runs to completion. Clients without streaming yield one chunk.
+        """
+        response = await self.generate(system_prompt, user_prompt, assistant_prompt=assistant_prompt)
+        if usage is not None:
+            usage.add(response.usage)
+        yield response.content
+
 class OpenAIClient(LLMClient):
     def __init__(self, model_name: str):
         super().__init__(model_name)
@@ -35,15 +65,7 @@ class OpenAIClient(LLMClient):
     ) -> LLMResponse:
         start = time.perf_counter()
         
-        kwargs = {
-            "model": self.model_name,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                *([{"role": "assistant", "content": assistant_prompt}] if assistant_prompt else []),
-                {"role": "user", "content": user_prompt},
-            ],
-            "temperature": 0.3,
-        }
+        kwargs = self._request_kwargs(system_prompt, user_prompt, assistant_prompt)
         if json_mode:
             kwargs["response_format"] = {"type": "json_object"}
 
@@ -59,6 +81,48 @@ class OpenAIClient(LLMClient):
             latency=duration
         )
 
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        assistant_prompt: Optional[str] = None,
+        usage: Optional[TokenUsage] = None,
+    ) -> AsyncIterator[str]:
+        stream = await self.client.chat.completions.create(
+            **self._request_kwargs(system_prompt, user_prompt, assistant_prompt),
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        try:
+            async for chunk in stream:
+                if chunk.usage and usage is not None:
+                    u = chunk.usage
+                    usage.add(TokenUsage(u.prompt_tokens, u.completion_tokens, u.total_tokens))
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Closing early drops the connection so the provider stops generating
+            await stream.close()
+
+    def _request_kwargs(self, system_prompt: str, user_prompt: str, assistant_prompt: Optional[str]) -> dict:
+        return {
+            "model": self.model_name,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                *([{"role": "assistant", "content": assistant_prompt}] if assistant_prompt else []),
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": 0.3,
+        }
+
+@lru_cache(maxsize=64)
+def _gemini_prompt_prefix(system_prompt: str, assistant_prompt: Optional[str]) -> str:
+    # System and few-shot parts are static per prompt type, so build them once
+    prefix = f"SYSTEM: {system_prompt}\n"
+    if assistant_prompt:
+        prefix += f"ASSISTANT (príklady): {assistant_prompt}\n"
+    return prefix + "USER: "
+
 class GeminiClient(LLMClient):
     def __init__(self, model_name: str):
         super().__init__(model_name)
@@ -75,10 +139,7 @@ class GeminiClient(LLMClient):
         start = time.perf_counter()
         
         # Gemini handles system prompts differently, simplifying here by prepending
-        full_prompt = f"SYSTEM: {system_prompt}\n"
-        if assistant_prompt:
-            full_prompt += f"ASSISTANT (príklady): {assistant_prompt}\n"
-        full_prompt += f"USER: {user_prompt}"
+        full_prompt = _gemini_prompt_prefix(system_prompt, assistant_prompt) + user_prompt
         if json_mode:
             full_prompt += "\nReturn valid JSON."
 
@@ -104,6 +165,92 @@ class GeminiClient(LLMClient):
 
         return LLMResponse(content=response.text, usage=usage, latency=duration)
 
+def openai_embedder(model_name: str = "text-embedding-3-small") -> EmbedFn:
+    client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+    async def embed(text: str) -> Sequence[float]:
+        response = await client.embeddings.create(model=model_name, input=text)
+        return response.data[0].embedding
+
+    return embed
+
+class ResponseCache:
+    """
+    In-memory cache of LLM responses shared by all wrapped clients.
+    Exact hits are keyed by the full prompt; semantic hits compare the user
+    prompt embedding against earlier prompts with the same model and system prompt.
+    """
+
+    def __init__(self, embed_fn: Optional[EmbedFn] = None, similarity_threshold: float = 0.97):
+        self.embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+        self._exact: Dict[Tuple, LLMResponse] = {}
+        self._vectors: Dict[Tuple, List[Tuple[np.ndarray, LLMResponse]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_exact(self, key: Tuple, user_prompt: str) -> Optional[LLMResponse]:
+        return self._exact.get(key + (user_prompt,))
+
+    def get_similar(self, key: Tuple, embedding: np.ndarray) -> Optional[LLMResponse]:
+        best_score = self.similarity_threshold
+        best = None
+        for vector, response in self._vectors.get(key, []):
+            score = float(np.dot(vector, embedding))
+            if score >= best_score:
+                best_score, best = score, response
+        return best
+
+    def put(self, key: Tuple, user_prompt: str, response: LLMResponse, embedding: Optional[np.ndarray] = None):
+        # Hits are free: report no tokens and no latency for them
+        cached = LLMResponse(content=response.content, usage=TokenUsage(), latency=0.0)
+        self._exact[key + (user_prompt,)] = cached
+        if embedding is not None:
+            self._vectors.setdefault(key, []).append((embedding, cached))
+
+    async def embed(self, text: str) -> np.ndarray:
+        vector = np.asarray(await self.embed_fn(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+class CachedLLMClient(LLMClient):
+    """Wraps another client and serves repeated prompts from a ResponseCache."""
+
+    def __init__(self, inner: LLMClient, cache: ResponseCache, default_policy: CachePolicy = "exact"):
+        super().__init__(inner.model_name)
+        self.inner = inner
+        self.cache = cache
+        self.default_policy = default_policy
+
+    async def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        json_mode: bool = False,
+        assistant_prompt: Optional[str] = None,
+        cache_policy: Optional[CachePolicy] = None,
+    ) -> LLMResponse:
+        policy = cache_policy or self.default_policy
+        if policy == "off":
+            return await self.inner.generate(system_prompt, user_prompt, json_mode, assistant_prompt)
+        if policy == "semantic" and (system_prompt in EXACT_ONLY_SYSTEM_PROMPTS or self.cache.embed_fn is None):
+            policy = "exact"
+
+        key = (self.model_name, system_prompt, assistant_prompt, json_mode)
+        cached = self.cache.get_exact(key, user_prompt)
+        embedding = None
+        if cached is None and policy == "semantic":
+            embedding = await self.cache.embed(user_prompt)
+            cached = self.cache.get_similar(key, embedding)
+        if cached is not None:
+            self.cache.hits += 1
+            return cached
+
+        self.cache.misses += 1
+        response = await self.inner.generate(system_prompt, user_prompt, json_mode, assistant_prompt)
+        self.cache.put(key, user_prompt, response, embedding)
+        return response
+
 def get_client(model_name: str) -> LLMClient:
     if "gpt" in model_name.lower():
         return OpenAIClient(model_name)
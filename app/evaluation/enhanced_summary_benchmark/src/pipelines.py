@@ -1,22 +1,69 @@
 import abc
 import asyncio
 import json
+import re
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 from nltk.tokenize import sent_tokenize
 
 from src.metrics import MetricsEngine, Timer
 from src.models import LLMClient
-from src.prompts import SlovakPrompts, MammRefinePrompts
+from src.prompts import (
+    MammRefinePrompts,
+    SlovakPrompts,
+    render_baseline_from_events_user,
+    render_critique_and_refine_user,
+    render_critique_rerank_user,
+    render_critique_user,
+    render_detect_user,
+    render_evaluator_user,
+    render_mamm_refine_user,
+    render_refine_user,
+    render_summary_rerank_user,
+    render_synthesis_user,
+)
 from src.types import (
     CritiqueCandidate,
     CritiqueResult,
     DetectionResult,
     DetectionVote,
+    LLMResponse,
     PipelineResult,
     TokenUsage,
 )
 
+# A blank line after sentence-final punctuation ends the refined paragraph
+_PARAGRAPH_END_RE = re.compile(r"[.!?][\"'“”»)]*[ \t]*\n[ \t]*\n")
+
+
+async def generate_paragraph(model: LLMClient, system_prompt: str, user_prompt: str) -> LLMResponse:
+    """
+    Streams a single-paragraph completion and stops reading once the paragraph ends,
+    so trailing text the model would still generate does not add latency.
+    """
+    start = time.perf_counter()
+    usage = TokenUsage()
+    text = ""
+    stream = model.generate_stream(system_prompt, user_prompt, usage=usage)
+    try:
+        async for chunk in stream:
+            text += chunk
+            match = _PARAGRAPH_END_RE.search(text)
+            if match:
+                text = text[:match.end()]
+                break
+    finally:
+        await stream.aclose()
+
+    if not usage.total_tokens:
+        # Usage is only reported at the end of a stream; estimate it after an early stop
+        in_len = (len(system_prompt) + len(user_prompt)) // 4
+        out_len = len(text) // 4
+        usage = TokenUsage(in_len, out_len, in_len + out_len)
+    return LLMResponse(content=text.strip(), usage=usage, latency=time.perf_counter() - start)
+
+
 class SummarizationPipeline(abc.ABC):
     def __init__(self, model: LLMClient, metrics_engine: MetricsEngine):
         self.model = model
@@ -91,7 +138,7 @@ class MultiStepPipeline(SummarizationPipeline):
         with Timer() as t2:
             summary_resp = await self.model.generate(
                 SlovakPrompts.ENHANCED_SYSTEM,
-                SlovakPrompts.SYNTHESIS_USER.format(events=events_resp.content, article=article)
+                render_synthesis_user(events=events_resp.content, article=article)
             )
         usage.add(summary_resp.usage)
         total_runtime = t1.duration + t2.duration
@@ -130,7 +177,7 @@ class SelfRefinePipeline(SummarizationPipeline):
                 )
                 initial_sum_resp = await self.model.generate(
                     SlovakPrompts.ENHANCED_SYSTEM,
-                    SlovakPrompts.SYNTHESIS_USER.format(events=events_resp.content, article=article)
+                    render_synthesis_user(events=events_resp.content, article=article)
                 )
             
             usage.add(events_resp.usage)
@@ -143,7 +190,7 @@ class SelfRefinePipeline(SummarizationPipeline):
             with Timer() as t_eval:
                 eval_resp = await self.evaluator.generate(
                     SlovakPrompts.EVALUATOR_SYSTEM,
-                    SlovakPrompts.EVALUATOR_USER.format(article=article, summary=current_summary),
+                    render_evaluator_user(article=article, summary=current_summary),
                     json_mode=True
                 )
             usage.add(eval_resp.usage)
@@ -155,9 +202,10 @@ class SelfRefinePipeline(SummarizationPipeline):
                 if not eval_json.get("passed", False):
                     # 3. Refine
                     with Timer() as t_refine:
-                        refine_resp = await self.model.generate(
+                        refine_resp = await generate_paragraph(
+                            self.model,
                             SlovakPrompts.ENHANCED_SYSTEM,
-                            SlovakPrompts.REFINE_USER.format(
+                            render_refine_user(
                                 article=article, 
                                 summary=current_summary,
                                 feedback=eval_json.get("feedback", "")
@@ -200,6 +248,7 @@ class MamRefinePipeline(SummarizationPipeline):
         rerank_model: LLMClient,
         metrics_engine: MetricsEngine,
         prefer_consistent_on_tie: bool = True,
+        fuse_critique_refine: bool = False,
     ):
         super().__init__(baseline_model, metrics_engine)
         self.detector_models = detector_models
@@ -207,6 +256,8 @@ class MamRefinePipeline(SummarizationPipeline):
         self.refine_models = refine_models
         self.rerank_model = rerank_model
         self.prefer_consistent_on_tie = prefer_consistent_on_tie
+        # One critique+refine call per refine model instead of critique -> rerank -> refine
+        self.fuse_critique_refine = fuse_critique_refine
         self.model_label = f"{self.model.model_name}+{self.rerank_model.model_name}_mam_refine"
 
     async def execute(self, article: str, reference: str, topic: Optional[str] = None) -> PipelineResult:
@@ -230,15 +281,20 @@ class MamRefinePipeline(SummarizationPipeline):
             usage.add(detect_usage)
             artifacts["detection"] = detection_result.to_dict()
 
-            critique_result, critique_usage = await self.critique_sentences_multi_agent(
-                article, topic, baseline_summary, detection_result
-            )
-            usage.add(critique_usage)
-            artifacts["critiques"] = critique_result.to_dict()
+            if self.fuse_critique_refine:
+                final_summary, refine_usage, refine_artifacts = await self.critique_and_refine_multi_agent_rerank(
+                    article, topic, baseline_summary, detection_result
+                )
+            else:
+                critique_result, critique_usage = await self.critique_sentences_multi_agent(
+                    article, topic, baseline_summary, detection_result
+                )
+                usage.add(critique_usage)
+                artifacts["critiques"] = critique_result.to_dict()
 
-            final_summary, refine_usage, refine_artifacts = await self.refine_summary_multi_agent_rerank(
-                article, topic, baseline_summary, critique_result
-            )
+                final_summary, refine_usage, refine_artifacts = await self.refine_summary_multi_agent_rerank(
+                    article, topic, baseline_summary, critique_result
+                )
             usage.add(refine_usage)
             artifacts.update(refine_artifacts)
 
@@ -270,12 +326,11 @@ class MamRefinePipeline(SummarizationPipeline):
 
         # Step 2: Compose baseline summary using events + original text
         summary_resp = await self.model.generate(
-            MammRefinePrompts.BASELINE_FROM_EVENTS_SYSTEM,
-            MammRefinePrompts.BASELINE_FROM_EVENTS_USER.format(
+            MammRefinePrompts.BASELINE_FROM_EVENTS_SYSTEM_WITH_EXAMPLES,
+            render_baseline_from_events_user(
                 events=events_text,
                 document=article,
             ),
-            assistant_prompt=MammRefinePrompts.BASELINE_FROM_EVENTS_ASSISTANT,
         )
         usage.add(summary_resp.usage)
         return summary_resp.content, usage, events_text
@@ -293,7 +348,7 @@ class MamRefinePipeline(SummarizationPipeline):
                 tasks = [
                     model.generate(
                         MammRefinePrompts.DETECT_SYSTEM,
-                        MammRefinePrompts.DETECT_USER.format(document=article, sentence=sentence),
+                        render_detect_user(document=article, sentence=sentence),
                         json_mode=True,
                     )
                     for model in self.detector_models
@@ -358,7 +413,7 @@ class MamRefinePipeline(SummarizationPipeline):
                     tasks.append(
                         model.generate(
                             MammRefinePrompts.CRITIQUE_SYSTEM,
-                            MammRefinePrompts.CRITIQUE_USER.format(
+                            render_critique_user(
                                 document=article,
                                 summary=summary,
                                 sentence=sentence,
@@ -370,11 +425,11 @@ class MamRefinePipeline(SummarizationPipeline):
                     continue
 
             responses = await asyncio.gather(*tasks, return_exceptions=True)
+            usage.add(TokenUsage.sum(r.usage for r in responses if not isinstance(r, BaseException)))
             candidates = []
             for resp, model in zip(responses, critique_models_used):
                 if isinstance(resp, Exception):
                     continue
-                usage.add(resp.usage)
                 candidates.append(CritiqueCandidate(text=resp.content, model=model.model_name))
 
             if not candidates:
@@ -417,9 +472,10 @@ class MamRefinePipeline(SummarizationPipeline):
         for model in self.refine_models:
             try:
                 tasks.append(
-                    model.generate(
+                    generate_paragraph(
+                        model,
                         MammRefinePrompts.REFINE_SYSTEM,
-                        MammRefinePrompts.REFINE_USER.format(
+                        render_mamm_refine_user(
                             document=article,
                             summary=baseline_summary,
                             feedback=feedback_text,
@@ -431,11 +487,11 @@ class MamRefinePipeline(SummarizationPipeline):
                 continue
 
         responses = await asyncio.gather(*tasks, return_exceptions=True)
+        usage.add(TokenUsage.sum(r.usage for r in responses if not isinstance(r, BaseException)))
         candidate_summaries = [{"model": self.model.model_name, "summary": baseline_summary}]
         for resp, model in zip(responses, refine_models_used):
             if isinstance(resp, Exception):
                 continue
-            usage.add(resp.usage)
             candidate_summaries.append({"model": model.model_name, "summary": resp.content})
         artifacts["candidate_summaries"] = candidate_summaries
 
@@ -446,6 +502,68 @@ class MamRefinePipeline(SummarizationPipeline):
         artifacts.update(rerank_trace)
         return final_summary, usage, artifacts
 
+    async def critique_and_refine_multi_agent_rerank(
+        self,
+        article: str,
+        topic: Optional[str],
+        baseline_summary: str,
+        detection_result: DetectionResult,
+    ) -> Tuple[str, TokenUsage, Dict[str, Any]]:
+        usage = TokenUsage()
+        artifacts: Dict[str, Any] = {}
+        flagged = [
+            idx for idx, inconsistent in enumerate(detection_result.is_inconsistent) if inconsistent
+        ]
+
+        if not flagged:
+            artifacts["critiques"] = CritiqueResult().to_dict()
+            artifacts["feedback"] = "No inconsistencies detected by DETECT stage."
+            artifacts["candidate_summaries"] = [{"model": self.model.model_name, "summary": baseline_summary}]
+            artifacts["rerank_winner_model"] = self.model.model_name
+            return baseline_summary, usage, artifacts
+
+        sentences_text = "\n".join(
+            f"Sentence {idx + 1}: {detection_result.sentences[idx]}" for idx in flagged
+        )
+        user_prompt = render_critique_and_refine_user(
+            document=article,
+            summary=baseline_summary,
+            sentences=sentences_text,
+        )
+        responses = await asyncio.gather(
+            *[
+                model.generate(MammRefinePrompts.CRITIQUE_AND_REFINE_SYSTEM, user_prompt, json_mode=True)
+                for model in self.refine_models
+            ],
+            return_exceptions=True,
+        )
+
+        usage.add(TokenUsage.sum(r.usage for r in responses if not isinstance(r, BaseException)))
+        candidates: List[CritiqueCandidate] = []
+        candidate_summaries = [{"model": self.model.model_name, "summary": baseline_summary}]
+        for resp, model in zip(responses, self.refine_models):
+            if isinstance(resp, Exception):
+                continue
+            parsed = self._safe_json(resp.content)
+            refined = str(parsed.get("refined_summary", "")).strip() if isinstance(parsed, dict) else ""
+            if not refined:
+                continue
+            critique_text = f"Chybný úsek: {parsed.get('error_span', '')}. Oprava: {parsed.get('fix', '')}"
+            candidates.append(CritiqueCandidate(text=critique_text, model=model.model_name))
+            candidate_summaries.append({"model": model.model_name, "summary": refined})
+
+        # One fused call covers every flagged sentence, so each shares the same critiques
+        artifacts["critiques"] = CritiqueResult(all_critiques={idx: candidates for idx in flagged}).to_dict()
+        artifacts["feedback"] = "\n\n".join(f"{c.model}: {c.text}" for c in candidates)
+        artifacts["candidate_summaries"] = candidate_summaries
+
+        final_summary, rerank_usage, rerank_trace = await self._rerank_summaries(
+            article, topic, candidate_summaries
+        )
+        usage.add(rerank_usage)
+        artifacts.update(rerank_trace)
+        return final_summary, usage, artifacts
+
     async def _select_best_critique(
         self,
         article: str,
@@ -461,7 +579,7 @@ class MamRefinePipeline(SummarizationPipeline):
             try:
                 resp = await self.rerank_model.generate(
                     MammRefinePrompts.CRITIQUE_RERANK_SYSTEM,
-                    MammRefinePrompts.CRITIQUE_RERANK_USER.format(
+                    render_critique_rerank_user(
                         document=article,
                         summary=summary,
                         critique1=best.text,
@@ -495,7 +613,7 @@ class MamRefinePipeline(SummarizationPipeline):
             try:
                 resp = await self.rerank_model.generate(
                     MammRefinePrompts.SUMMARY_RERANK_SYSTEM,
-                    MammRefinePrompts.SUMMARY_RERANK_USER.format(
+                    render_summary_rerank_user(
                         document=article,
                         summary1=best["summary"],
                         summary2=contender["summary"],
@@ -1,3 +1,7 @@
+from string import Formatter
+from typing import Any, Callable
+
+
 class SlovakPrompts:
     # Approach 1: Basic
     BASIC_SYSTEM = "Si sumarizátor."
@@ -136,6 +140,9 @@ class MammRefinePrompts:
         "o zvrátení Obamacare, ten sa neskôr zastavil v Senáte, zatiaľ čo plány daňovej reformy a politiky v oblasti infraštruktúry rozdelili "
         "Republikánov. Politickí analytici varovali, že kľúčové termíny pre rozpočty, ako aj voľby v roku 2018, taktiež ovplyvnia zvyšok roka 2017."
     )
+    # Few-shot examples are constant, so they live in the system prompt where they form
+    # part of the cacheable prefix instead of a separate assistant turn.
+    BASELINE_FROM_EVENTS_SYSTEM_WITH_EXAMPLES = BASELINE_FROM_EVENTS_SYSTEM + "\n\n" + BASELINE_FROM_EVENTS_ASSISTANT
 
     BASELINE_FROM_EVENTS_USER = (
     "Tvojou úlohou je vytvoriť vysoko relevantné a fakticky presné zhrnutie článku, "
@@ -180,7 +187,7 @@ class MammRefinePrompts:
         "Urči, či je veta fakticky konzistentná s dokumentom vyššie.\n"
         "Veta je konzistentná, ak ju dokument priamo uvádza alebo jednoznačne implikuje.\n\n"
         "Odpovedz stručne do 50 slov a vráť platný JSON:\n"
-        '{"reasoning": "...", "answer": "yes" alebo "no"}\n'
+        '{{"reasoning": "...", "answer": "yes" alebo "no"}}\n'
         "Nepridávaj žiadny text mimo JSON."
     )
 
@@ -203,7 +210,7 @@ class MammRefinePrompts:
         "Kritika 1:\n{critique1}\n\n"
         "Kritika 2:\n{critique2}\n\n"
         "Vyber kritiku, ktorá najlepšie identifikuje faktickú chybu a obsahuje presný návrh opravy.\n"
-        'Vráť platný JSON: {"reasoning": "...", "answer": 1 alebo 2}\n'
+        'Vráť platný JSON: {{"reasoning": "...", "answer": 1 alebo 2}}\n'
         "Bez ďalšieho textu."
     )
 
@@ -217,12 +224,64 @@ class MammRefinePrompts:
         "Urob minimum zmien a nepridávaj úvodné ani záverečné vety."
     )
 
+    # Fused CRITIQUE + REFINE: one call returns both the critique and the corrected summary
+    CRITIQUE_AND_REFINE_SYSTEM = (
+        "Identifikuješ faktické chyby v zhrnutí a opravuješ ich minimálnymi úpravami."
+    )
+    CRITIQUE_AND_REFINE_USER = (
+        "Zhrnul som tento dokument:\n\n"
+        "{document}\n\n"
+        "Zhrnutie:\n{summary}\n\n"
+        "Problémové vety:\n{sentences}\n\n"
+        "Vysvetli, ktorá časť problémových viet je fakticky nesprávna vzhľadom na dokument, navrhni opravu "
+        "a potom uprav zhrnutie tak, aby už tieto chyby neobsahovalo.\n"
+        "Urob minimum zmien a nepridávaj úvodné ani záverečné vety.\n"
+        "Vráť platný JSON:\n"
+        '{{"error_span": "chybný úsek", "fix": "návrh opravy", "refined_summary": "upravené zhrnutie"}}\n'
+        "Bez ďalšieho textu."
+    )
+
     SUMMARY_RERANK_SYSTEM = "Vyberáš najvernejšie zhrnutie podľa dokumentu."
     SUMMARY_RERANK_USER = (
         "Dokument:\n{document}\n\n"
         "Kandidátne zhrnutie 1:\n{summary1}\n\n"
         "Kandidátne zhrnutie 2:\n{summary2}\n\n"
         "Vyber zhrnutie, ktoré má najmenej faktických nezrovnalostí s dokumentom.\n"
-        'Vráť platný JSON: {"reasoning": "...", "answer": 1 alebo 2}\n'
+        'Vráť platný JSON: {{"reasoning": "...", "answer": 1 alebo 2}}\n'
         "Bez ďalšieho textu."
     )
+
+
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Splits a str.format template once at import time, so rendering is a single
+    join instead of re-parsing the whole template on every call.
+    """
+    segments = []
+    for literal, field, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported placeholder in prompt template: {{{field}}}")
+        segments.append((literal, field))
+
+    def render(**values: Any) -> str:
+        parts = []
+        for literal, field in segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
+
+    return render
+
+
+# Renderers for the multi-placeholder prompts on the pipelines' hot path
+render_synthesis_user = compile_template(SlovakPrompts.SYNTHESIS_USER)
+render_evaluator_user = compile_template(SlovakPrompts.EVALUATOR_USER)
+render_refine_user = compile_template(SlovakPrompts.REFINE_USER)
+render_baseline_from_events_user = compile_template(MammRefinePrompts.BASELINE_FROM_EVENTS_USER)
+render_detect_user = compile_template(MammRefinePrompts.DETECT_USER)
+render_critique_user = compile_template(MammRefinePrompts.CRITIQUE_USER)
+render_critique_rerank_user = compile_template(MammRefinePrompts.CRITIQUE_RERANK_USER)
+render_mamm_refine_user = compile_template(MammRefinePrompts.REFINE_USER)
+render_critique_and_refine_user = compile_template(MammRefinePrompts.CRITIQUE_AND_REFINE_USER)
+render_summary_rerank_user = compile_template(MammRefinePrompts.SUMMARY_RERANK_USER)
@@ -1,12 +1,48 @@
 import asyncio
 import json
+import re
 import unittest
+from typing import Optional
 
 from src.models import LLMClient
 from src.pipelines import MamRefinePipeline
 from src.types import MetricResult, PipelineResult, TokenUsage, LLMResponse
 
 
+def _canned(content: str) -> LLMResponse:
+    return LLMResponse(content=content, usage=TokenUsage(1, 1, 2), latency=0.01)
+
+
+# Canned responses are built once; LLMResponse is frozen so sharing instances is safe.
+_EVENTS = _canned(
+    "- Modernizácia trate Žilina–Košice\n- Dokončenie úsekov v roku 2027\n- Zvýšenie rýchlosti na 160 km/h"
+)
+_BASELINE = _canned(
+    "The rail upgrade will finish in 1990. "
+    "The project raises speed to 160 km/h with new signaling."
+)
+_DETECT_NO = _canned(json.dumps({"reasoning": "mock", "answer": "no"}))
+_DETECT_YES = _canned(json.dumps({"reasoning": "mock", "answer": "yes"}))
+_CRITIQUE = _canned("The error span: 1990. Replace with 2027 based on the document.")
+_REFINED = _canned("The rail upgrade will finish in 2027 and will raise speeds to 160 km/h.")
+_CRITIQUE_AND_REFINE = _canned(
+    json.dumps(
+        {
+            "error_span": "1990",
+            "fix": "Replace with 2027 based on the document.",
+            "refined_summary": "The rail upgrade will finish in 2027 and will raise speeds to 160 km/h.",
+        }
+    )
+)
+_RERANK_CRITIQUE = _canned(json.dumps({"reasoning": "prefer second critique", "answer": 2}))
+_RERANK_SUMMARY_1 = _canned(json.dumps({"reasoning": "prefer fixed date", "answer": 1}))
+_RERANK_SUMMARY_2 = _canned(json.dumps({"reasoning": "prefer fixed date", "answer": 2}))
+_NOOP = LLMResponse(content="noop", usage=TokenUsage(0, 0, 0), latency=0.0)
+
+_CRITIQUE_PAIR_RE = re.compile(r"Critique 1|Kritika 1")
+_TAIL_RE = re.compile(r"(?:Candidate Summary 2:|Kandidátne zhrnutie 2:)(.*)\Z", re.DOTALL)
+
+
 class FakeLLM(LLMClient):
     """
     Lightweight fake client to exercise the MAMM-REFINE pipeline without real API calls.
@@ -15,57 +51,38 @@ class FakeLLM(LLMClient):
     def __init__(self, model_name: str):
         super().__init__(model_name)
 
-    async def generate(self, system_prompt: str, user_prompt: str, json_mode: bool = False) -> LLMResponse:
-        # Event extraction for baseline
-        if "UDALOSTI A TÉMY" in user_prompt or "hlavných udalostí" in user_prompt:
-            content = "- Modernizácia trate Žilina–Košice\n- Dokončenie úsekov v roku 2027\n- Zvýšenie rýchlosti na 160 km/h"
-            return LLMResponse(content=content, usage=TokenUsage(1, 1, 2), latency=0.01)
-
-        # Baseline from events
-        if "ZHRNUTIE:" in user_prompt and "UDALOSTI A TÉMY" in user_prompt:
-            baseline = "ŽSR modernizujú koridor Žilina–Košice, prvé úseky majú byť hotové v roku 2027 a rýchlosť stúpne na 160 km/h."
-            return LLMResponse(content=baseline, usage=TokenUsage(1, 1, 2), latency=0.01)
-
-        # Baseline generator
+    async def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        json_mode: bool = False,
+        assistant_prompt: Optional[str] = None,
+    ) -> LLMResponse:
+        # Baseline generator: events first, then a summary with a wrong year
         if "baseline" in self.model_name:
-            content = (
-                "The rail upgrade will finish in 1990. "
-                "The project raises speed to 160 km/h with new signaling."
-            )
-            return LLMResponse(content=content, usage=TokenUsage(1, 1, 2), latency=0.01)
+            return _BASELINE if "ZHRNUTIE:" in user_prompt else _EVENTS
 
         # Detector models: mark 1990 as inconsistent
         if "detector" in self.model_name:
-            answer = "no" if "1990" in user_prompt else "yes"
-            payload = {"reasoning": "mock", "answer": answer}
-            return LLMResponse(content=json.dumps(payload), usage=TokenUsage(1, 1, 2), latency=0.01)
+            return _DETECT_NO if "1990" in user_prompt else _DETECT_YES
 
         # Critique models: always point to the wrong year
         if "critique" in self.model_name:
-            critique_text = "The error span: 1990. Replace with 2027 based on the document."
-            return LLMResponse(content=critique_text, usage=TokenUsage(1, 1, 2), latency=0.01)
+            return _CRITIQUE
 
-        # Refiners: generate a corrected summary
+        # Refiners: generate a corrected summary (JSON when critique and refine are fused)
         if "refine" in self.model_name:
-            refined = "The rail upgrade will finish in 2027 and will raise speeds to 160 km/h."
-            return LLMResponse(content=refined, usage=TokenUsage(1, 1, 2), latency=0.01)
+            return _CRITIQUE_AND_REFINE if json_mode else _REFINED
 
         # Reranker: choose options mentioning 2027
         if "rerank" in self.model_name:
-            if "Critique 1" in user_prompt or "Kritika 1" in user_prompt:
-                payload = {"reasoning": "prefer second critique", "answer": 2}
-            else:
-                if "Candidate Summary 2:" in user_prompt:
-                    tail = user_prompt.split("Candidate Summary 2:")[-1]
-                elif "Kandidátne zhrnutie 2:" in user_prompt:
-                    tail = user_prompt.split("Kandidátne zhrnutie 2:")[-1]
-                else:
-                    tail = user_prompt
-                answer = 2 if "2027" in tail else 1
-                payload = {"reasoning": "prefer fixed date", "answer": answer}
-            return LLMResponse(content=json.dumps(payload), usage=TokenUsage(1, 1, 2), latency=0.01)
-
-        return LLMResponse(content="noop", usage=TokenUsage(0, 0, 0), latency=0.0)
+            if _CRITIQUE_PAIR_RE.search(user_prompt):
+                return _RERANK_CRITIQUE
+            match = _TAIL_RE.search(user_prompt)
+            tail = match.group(1) if match else user_prompt
+            return _RERANK_SUMMARY_2 if "2027" in tail else _RERANK_SUMMARY_1
+
+        return _NOOP
 
 
 class DummyMetrics:
@@ -85,29 +102,27 @@ class DummyMetrics:
 
 
 class MamRefinePipelineTest(unittest.TestCase):
-    def test_mam_refine_pipeline_runs_end_to_end(self):
-        article = (
-            "Železnice Slovenskej republiky začali modernizáciu s cieľom dokončiť prvé úseky v roku 2027, "
-            "pričom rýchlosť vlakov má stúpnuť na 160 km/h."
-        )
-        reference = "Modernizácia má skončiť v roku 2027 a zrýchliť vlaky na 160 km/h."
-
-        baseline = FakeLLM("fake-baseline")
-        detectors = [FakeLLM("fake-detector-a"), FakeLLM("fake-detector-b")]
-        critiques = [FakeLLM("fake-critique-a"), FakeLLM("fake-critique-b")]
-        refiners = [FakeLLM("fake-refine-a"), FakeLLM("fake-refine-b")]
-        reranker = FakeLLM("fake-rerank")
-
-        pipeline = MamRefinePipeline(
-            baseline_model=baseline,
-            detector_models=detectors,
-            critique_models=critiques,
-            refine_models=refiners,
-            rerank_model=reranker,
+    ARTICLE = (
+        "Železnice Slovenskej republiky začali modernizáciu s cieľom dokončiť prvé úseky v roku 2027, "
+        "pričom rýchlosť vlakov má stúpnuť na 160 km/h."
+    )
+    REFERENCE = "Modernizácia má skončiť v roku 2027 a zrýchliť vlaky na 160 km/h."
+
+    def _build_pipeline(self, **kwargs) -> MamRefinePipeline:
+        return MamRefinePipeline(
+            baseline_model=FakeLLM("fake-baseline"),
+            detector_models=[FakeLLM("fake-detector-a"), FakeLLM("fake-detector-b")],
+            critique_models=[FakeLLM("fake-critique-a"), FakeLLM("fake-critique-b")],
+            refine_models=[FakeLLM("fake-refine-a"), FakeLLM("fake-refine-b")],
+            rerank_model=FakeLLM("fake-rerank"),
             metrics_engine=DummyMetrics(),  # type: ignore[arg-type]
+            **kwargs,
         )
 
-        result: PipelineResult = asyncio.run(pipeline.execute(article, reference, topic="Doprava"))
+    def test_mam_refine_pipeline_runs_end_to_end(self):
+        pipeline = self._build_pipeline()
+
+        result: PipelineResult = asyncio.run(pipeline.execute(self.ARTICLE, self.REFERENCE, topic="Doprava"))
 
         detection_flags = result.intermediate_artifacts["detection"]["is_inconsistent"]
         best_critiques = result.intermediate_artifacts["critiques"]["best_critiques"]
@@ -118,6 +133,19 @@ class MamRefinePipelineTest(unittest.TestCase):
         self.assertGreaterEqual(len(candidate_summaries), 2)
         self.assertIn("2027", result.final_summary)
 
+    def test_fused_critique_and_refine(self):
+        pipeline = self._build_pipeline(fuse_critique_refine=True)
+
+        result: PipelineResult = asyncio.run(pipeline.execute(self.ARTICLE, self.REFERENCE, topic="Doprava"))
+
+        all_critiques = result.intermediate_artifacts["critiques"]["all_critiques"]
+        candidate_summaries = result.intermediate_artifacts["candidate_summaries"]
+
+        self.assertIn(0, all_critiques)
+        self.assertIn("1990", all_critiques[0][0]["text"])
+        self.assertEqual(len(candidate_summaries), 3)
+        self.assertIn("2027", result.final_summary)
+
 
 if __name__ == "__main__":
     unittest.main()
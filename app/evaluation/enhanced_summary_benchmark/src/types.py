@@ -1,7 +1,9 @@
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Optional, List, Any
+from dataclasses import dataclass, field
+from typing import Dict, Optional, List, Any, Iterable
 
-@dataclass
+import numpy as np
+
+@dataclass(slots=True)
 class TokenUsage:
     input_tokens: int = 0
     output_tokens: int = 0
@@ -12,13 +14,23 @@ class TokenUsage:
         self.output_tokens += other.output_tokens
         self.total_tokens += other.total_tokens
 
-@dataclass
+    @classmethod
+    def sum(cls, items: Iterable['TokenUsage']) -> 'TokenUsage':
+        """Aggregate many usages in one vectorised reduction instead of repeated add()."""
+        flat = np.fromiter(
+            (n for u in items for n in (u.input_tokens, u.output_tokens, u.total_tokens)),
+            dtype=np.int64,
+        )
+        totals = flat.reshape(-1, 3).sum(axis=0)
+        return cls(*totals.tolist())
+
+@dataclass(frozen=True, slots=True)
 class LLMResponse:
     content: str
     usage: TokenUsage
     latency: float
 
-@dataclass
+@dataclass(slots=True)
 class MetricResult:
     bleu: float
     rouge_1: float
@@ -29,7 +41,7 @@ class MetricResult:
     token_usage: TokenUsage
     latencies: Dict[str, float]
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     model_name: str
     approach_name: str
@@ -38,40 +50,59 @@ class PipelineResult:
     final_summary: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionVote:
     model: str
     answer: str
     reasoning: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"model": self.model, "answer": self.answer, "reasoning": self.reasoning}
+
 
-@dataclass
+@dataclass(slots=True)
 class DetectionResult:
     sentences: List[str]
     is_inconsistent: List[bool]
     votes: Dict[int, List[DetectionVote]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
+        # Flat str-only records: build the dicts directly instead of asdict's recursive deepcopy.
+        votes: Dict[int, List[Dict[str, Any]]] = {}
+        for idx, vote_list in self.votes.items():
+            serialised = []
+            for vote in vote_list:
+                serialised.append(vote.to_dict())
+            votes[idx] = serialised
         return {
             "sentences": self.sentences,
             "is_inconsistent": self.is_inconsistent,
-            "votes": {idx: [asdict(v) for v in vote_list] for idx, vote_list in self.votes.items()},
+            "votes": votes,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CritiqueCandidate:
     text: str
     model: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"text": self.text, "model": self.model}
+
 
-@dataclass
+@dataclass(slots=True)
 class CritiqueResult:
     best_critiques: Dict[int, CritiqueCandidate] = field(default_factory=dict)
     all_critiques: Dict[int, List[CritiqueCandidate]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
+        all_critiques: Dict[int, List[Dict[str, Any]]] = {}
+        for idx, candidates in self.all_critiques.items():
+            serialised = []
+            for candidate in candidates:
+                serialised.append(candidate.to_dict())
+            all_critiques[idx] = serialised
         return {
-            "best_critiques": {idx: asdict(c) for idx, c in self.best_critiques.items()},
-            "all_critiques": {idx: [asdict(c) for c in lst] for idx, lst in self.all_critiques.items()},
+            "best_critiques": {idx: c.to_dict() for idx, c in self.best_critiques.items()},
+            "all_critiques": all_critiques,
         }
@@ -0,0 +1,27 @@
+"""Numba kernel for the longest common subsequence behind ROUGE-L."""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def lcs_len(x: np.ndarray, y: np.ndarray) -> int:
+    """LCS length of two int32 token-id arrays using two rolling DP rows."""
+    m = y.shape[0]
+    prev = np.zeros(m + 1, dtype=np.int32)
+    curr = np.zeros(m + 1, dtype=np.int32)
+    for i in range(x.shape[0]):
+        xi = x[i]
+        for j in range(m):
+            if xi == y[j]:
+                curr[j + 1] = prev[j] + 1
+            elif prev[j + 1] >= curr[j]:
+                curr[j + 1] = prev[j + 1]
+            else:
+                curr[j + 1] = curr[j]
+        prev, curr = curr, prev
+    return prev[m]
+
+
+# Compile at import so the first scored sample does not pay the JIT cost.
+lcs_len(np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int32))
@@ -1,53 +1,174 @@
 import math
 import re
 from collections import Counter
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Hashable, List, Mapping, Sequence, Tuple
 
+import numpy as np
 
-TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+try:
+    if __package__ in (None, ""):
+        from _lcs_numba import lcs_len as _lcs_len_jit  # type: ignore
+    else:
+        from ._lcs_numba import lcs_len as _lcs_len_jit
+except ImportError:
+    # Numba is optional; fall back to the NumPy / pure-Python implementations.
+    _lcs_len_jit = None
+
+
+try:
+    # Possessive `++` never backtracks into a word run (supported from Python 3.11).
+    TOKEN_PATTERN = re.compile(r"\w++|[^\w\s]", re.UNICODE)
+except re.error:
+    TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+# Bits per token id when packing an n-gram into a single int key; widened per pair if needed.
+_NGRAM_ID_BITS = 16
+
+# Below this many distinct n-grams the clipped overlap is cheaper as a plain generator.
+_OVERLAP_VECTORIZE_MIN_NGRAMS = 64
+
+# From this reference length the bit-parallel LCS beats the O(n*m) Numba kernel.
+_LCS_BITPARALLEL_MIN_TOKENS = 256
 
 
 def tokenize(text: str) -> List[str]:
     """Convert text into a list of lowercase tokens."""
-    if not text:
-        return []
-    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token.strip()]
+    # The pattern never matches whitespace, so findall's list is returned as is.
+    # str.lower() already has a dedicated ASCII fast path; a str.translate table is ~3x slower.
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
 
+@lru_cache(maxsize=4096)
+def _tokenize_cached(text: str) -> Tuple[str, ...]:
+    """Memoised tokenize; the same summary is scored by BLEU and ROUGE and across models."""
+    return tuple(tokenize(text))
 
-def _ngrams(tokens: List[str], n: int) -> Counter:
+
+def _ngrams(tokens: Sequence[str], n: int) -> Counter:
     if n <= 0 or n > len(tokens):
         return Counter()
     return Counter(tuple(tokens[i : i + n]) for i in range(len(tokens) - n + 1))
 
 
-def compute_bleu(candidate: str, reference: str, max_n: int = 4, smoothing: float = 1e-9) -> float:
-    """Compute a simple BLEU score between candidate and reference summaries."""
-    ref_tokens = tokenize(reference)
-    cand_tokens = tokenize(candidate)
-
-    if not cand_tokens:
+class TokenPool:
+    """
+    Interns tokens to small int ids shared by every metric of one candidate/reference pair,
+    so each token is hashed once for BLEU, ROUGE-N and ROUGE-L together.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+
+    def add(self, token: str) -> int:
+        ids = self._ids
+        return ids.setdefault(token, len(ids))
+
+    def encode(self, tokens: Sequence[str]) -> np.ndarray:
+        ids = self._ids
+        return np.fromiter((ids.setdefault(token, len(ids)) for token in tokens), dtype=np.int32, count=len(tokens))
+
+    def lookup(self, tokens: Sequence[str], unknown: int) -> np.ndarray:
+        """Encode without growing the pool; tokens not in it all map to `unknown`."""
+        get = self._ids.get
+        return np.fromiter((get(token, unknown) for token in tokens), dtype=np.int32, count=len(tokens))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def bits(self) -> int:
+        """Bit width per id when packing n-grams; never below _NGRAM_ID_BITS."""
+        return max(_NGRAM_ID_BITS, len(self._ids).bit_length())
+
+
+def _ngrams_int(ids: Sequence[int], n: int, bits: int = _NGRAM_ID_BITS) -> Dict[int, int]:
+    """Count n-grams of interned token ids, each packed into one int key."""
+    counts: Dict[int, int] = {}
+    if n <= 0 or n > len(ids):
+        return counts
+    get = counts.get
+    if n == 1:
+        for key in ids:
+            counts[key] = get(key, 0) + 1
+        return counts
+
+    mask = (1 << (bits * n)) - 1
+    key = 0
+    for i, token_id in enumerate(ids):
+        key = ((key << bits) | token_id) & mask
+        if i >= n - 1:
+            counts[key] = get(key, 0) + 1
+    return counts
+
+
+class _NgramCounts(Dict[int, Dict[int, int]]):
+    """n -> n-gram counts of one id sequence, built on first access."""
+
+    def __init__(self, ids: Sequence[int], bits: int = _NGRAM_ID_BITS) -> None:
+        super().__init__()
+        self.ids = ids
+        self.bits = bits
+
+    def __missing__(self, n: int) -> Dict[int, int]:
+        counts = self[n] = _ngrams_int(self.ids, n, self.bits)
+        return counts
+
+
+def _counts_arrays(
+    counts: Mapping[Hashable, int], other: Mapping[Hashable, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Align two count maps on the keys of the smaller one (absent keys count as 0)."""
+    if len(other) < len(counts):
+        counts, other = other, counts
+    get = other.get
+    a = np.fromiter(counts.values(), dtype=np.int32, count=len(counts))
+    b = np.fromiter((get(key, 0) for key in counts), dtype=np.int32, count=len(counts))
+    return a, b
+
+
+def _clipped_overlap(counts: Mapping[Hashable, int], other: Mapping[Hashable, int]) -> int:
+    """Sum of min(counts[g], other[g]) over all n-grams g; symmetric in its arguments."""
+    if min(len(counts), len(other)) < _OVERLAP_VECTORIZE_MIN_NGRAMS:
+        if len(other) < len(counts):
+            counts, other = other, counts
+        get = other.get
+        return sum(min(count, get(ng, 0)) for ng, count in counts.items())
+    a, b = _counts_arrays(counts, other)
+    return int(np.minimum(a, b).sum())
+
+
+def _bleu_from_counts(
+    cand_counts_by_n: Mapping[int, Mapping[Hashable, int]],
+    ref_counts_by_n: Mapping[int, Mapping[Hashable, int]],
+    cand_len: int,
+    ref_len: int,
+    max_n: int = 4,
+    smoothing: float = 1e-9,
+    lazy_bigrams: bool = True,
+) -> float:
+    if cand_len == 0:
         return 0.0
 
     weights = [1.0 / max_n] * max_n
     log_precision_sum = 0.0
 
     for n in range(1, max_n + 1):
-        ref_counts = _ngrams(ref_tokens, n)
-        cand_counts = _ngrams(cand_tokens, n)
+        ref_counts = ref_counts_by_n[n]
+        cand_counts = cand_counts_by_n[n]
 
         if not cand_counts:
             return 0.0
 
-        overlap = sum(min(count, ref_counts[ng]) for ng, count in cand_counts.items())
+        overlap = _clipped_overlap(cand_counts, ref_counts)
+        if lazy_bigrams and overlap == 0 and n <= 2:
+            # No shared unigram/bigram: only the smoothing term keeps the score above zero,
+            # so skip building the higher-order n-grams entirely.
+            return 0.0
         total = sum(cand_counts.values())
         precision = (overlap + smoothing) / (total + smoothing)
         log_precision_sum += weights[n - 1] * math.log(precision)
 
-    ref_len = len(ref_tokens)
-    cand_len = len(cand_tokens)
-    if cand_len == 0:
-        return 0.0
-
     if cand_len > ref_len:
         brevity_penalty = 1.0
     else:
@@ -56,6 +177,68 @@ def compute_bleu(candidate: str, reference: str, max_n: int = 4, smoothing: floa
     return brevity_penalty * math.exp(log_precision_sum)
 
 
+class ReferenceIndex:
+    """
+    Tokens, int ids and 1..4-gram counts of one reference summary, built once and reused
+    for every candidate scored against it. Read-only after construction, so it can be
+    shared across metric threads.
+    """
+
+    def __init__(self, reference: str, max_n: int = 4) -> None:
+        self.tokens = _tokenize_cached(reference)
+        self.pool = TokenPool()
+        self.ids = self.pool.encode(self.tokens)
+        # Candidate tokens absent from the reference can never match it, so they all share
+        # one extra id; the id space (and with it the n-gram key layout) is fixed up front.
+        self.unknown_id = len(self.pool)
+        self.bits = max(_NGRAM_ID_BITS, self.unknown_id.bit_length())
+        self.ngrams = _NgramCounts(self.ids.tolist(), self.bits)
+        for n in range(1, max_n + 1):
+            self.ngrams[n]
+
+    def encode(self, tokens: Sequence[str]) -> np.ndarray:
+        return self.pool.lookup(tokens, self.unknown_id)
+
+
+@lru_cache(maxsize=1024)
+def reference_index(reference: str) -> ReferenceIndex:
+    """Shared ReferenceIndex per reference text; each article's reference is scored once per model."""
+    return ReferenceIndex(reference)
+
+
+def compute_bleu_against(
+    candidate: str, ref_index: ReferenceIndex, max_n: int = 4, smoothing: float = 1e-9, lazy_bigrams: bool = True
+) -> float:
+    """BLEU of `candidate` against a prebuilt ReferenceIndex."""
+    cand_tokens = _tokenize_cached(candidate)
+    if not cand_tokens:
+        return 0.0
+
+    return _bleu_from_counts(
+        _NgramCounts(ref_index.encode(cand_tokens).tolist(), ref_index.bits),
+        ref_index.ngrams,
+        len(cand_tokens),
+        len(ref_index.tokens),
+        max_n=max_n,
+        smoothing=smoothing,
+        lazy_bigrams=lazy_bigrams,
+    )
+
+
+def compute_bleu(
+    candidate: str, reference: str, max_n: int = 4, smoothing: float = 1e-9, lazy_bigrams: bool = True
+) -> float:
+    """
+    Compute a simple BLEU score between candidate and reference summaries.
+
+    With `lazy_bigrams` the score is 0.0 as soon as the unigram or bigram overlap is empty;
+    pass False to reproduce the fully smoothed value.
+    """
+    return compute_bleu_against(
+        candidate, reference_index(reference), max_n=max_n, smoothing=smoothing, lazy_bigrams=lazy_bigrams
+    )
+
+
 def _precision_recall_f1(overlap: int, ref_total: int, cand_total: int) -> Tuple[float, float, float]:
     recall = overlap / ref_total if ref_total else 0.0
     precision = overlap / cand_total if cand_total else 0.0
@@ -66,11 +249,8 @@ def _precision_recall_f1(overlap: int, ref_total: int, cand_total: int) -> Tuple
     return precision, recall, f1
 
 
-def _rouge_n(candidate_tokens: List[str], reference_tokens: List[str], n: int) -> Dict[str, float]:
-    ref_counts = _ngrams(reference_tokens, n)
-    cand_counts = _ngrams(candidate_tokens, n)
-
-    overlap = sum(min(count, cand_counts[ng]) for ng, count in ref_counts.items())
+def _rouge_n_from_counts(cand_counts: Mapping[Hashable, int], ref_counts: Mapping[Hashable, int]) -> Dict[str, float]:
+    overlap = _clipped_overlap(ref_counts, cand_counts)
     ref_total = sum(ref_counts.values())
     cand_total = sum(cand_counts.values())
 
@@ -78,44 +258,108 @@ def _rouge_n(candidate_tokens: List[str], reference_tokens: List[str], n: int) -
     return {"precision": precision, "recall": recall, "f1": f1}
 
 
-def _lcs_length(x: List[str], y: List[str]) -> int:
-    if not x or not y:
-        return 0
+def _rouge_n(candidate_tokens: Sequence[str], reference_tokens: Sequence[str], n: int) -> Dict[str, float]:
+    return _rouge_n_from_counts(_ngrams(candidate_tokens, n), _ngrams(reference_tokens, n))
 
-    dp = [[0] * (len(y) + 1) for _ in range(len(x) + 1)]
-    for i in range(len(x)):
-        for j in range(len(y)):
-            if x[i] == y[j]:
-                dp[i + 1][j + 1] = dp[i][j] + 1
-            else:
-                dp[i + 1][j + 1] = max(dp[i][j + 1], dp[i + 1][j])
-    return dp[-1][-1]
 
+def _lcs_length(x: Sequence[str], y: Sequence[str]) -> int:
+    pool = TokenPool()
+    return _lcs_length_ids(pool.encode(x), pool.encode(y))
 
-def _rouge_l(candidate_tokens: List[str], reference_tokens: List[str]) -> Dict[str, float]:
+
+def _lcs_length_ids(xi: np.ndarray, yj: np.ndarray) -> int:
+    """LCS length of two int32 token-id arrays interned through the same TokenPool."""
+    if not len(xi) or not len(yj):
+        return 0
+    if _lcs_len_jit is not None and len(yj) < _LCS_BITPARALLEL_MIN_TOKENS:
+        return int(_lcs_len_jit(xi, yj))
+    return _lcs_length_bitparallel(xi.tolist(), yj.tolist())
+
+
+def _lcs_length_bitparallel(x: Sequence[int], y: Sequence[int]) -> int:
+    """
+    Hyyrö's bit-parallel LCS: one bit of V per reference token, updated with a handful
+    of bitwise ops per candidate token. Python ints are unbounded, so a reference of any
+    length fits in a single word and no multi-word carry handling is needed.
+    """
+    matches: Dict[int, int] = {}
+    for j, token_id in enumerate(y):
+        matches[token_id] = matches.get(token_id, 0) | (1 << j)
+
+    full = (1 << len(y)) - 1
+    v = full
+    get = matches.get
+    for token_id in x:
+        u = v & get(token_id, 0)
+        v = ((v + u) | (v - u)) & full
+    return len(y) - v.bit_count()
+
+
+def _rouge_l(candidate_tokens: Sequence[str], reference_tokens: Sequence[str]) -> Dict[str, float]:
     lcs = _lcs_length(candidate_tokens, reference_tokens)
-    ref_total = len(reference_tokens)
-    cand_total = len(candidate_tokens)
+    return _rouge_l_from_lcs(lcs, len(candidate_tokens), len(reference_tokens))
 
+
+def _rouge_l_from_lcs(lcs: int, cand_total: int, ref_total: int) -> Dict[str, float]:
     precision, recall, f1 = _precision_recall_f1(lcs, ref_total, cand_total)
     return {"precision": precision, "recall": recall, "f1": f1}
 
 
-def compute_rouge_scores(candidate: str, reference: str) -> Dict[str, Dict[str, float]]:
-    """Compute ROUGE-1, ROUGE-2 and ROUGE-L scores."""
-    candidate_tokens = tokenize(candidate)
-    reference_tokens = tokenize(reference)
+def _empty_rouge() -> Dict[str, Dict[str, float]]:
+    return {
+        "rouge-1": {"precision": 0.0, "recall": 0.0, "f1": 0.0},
+        "rouge-2": {"precision": 0.0, "recall": 0.0, "f1": 0.0},
+        "rouge-l": {"precision": 0.0, "recall": 0.0, "f1": 0.0},
+    }
+
 
-    if not candidate_tokens or not reference_tokens:
-        return {
-            "rouge-1": {"precision": 0.0, "recall": 0.0, "f1": 0.0},
-            "rouge-2": {"precision": 0.0, "recall": 0.0, "f1": 0.0},
-            "rouge-l": {"precision": 0.0, "recall": 0.0, "f1": 0.0},
-        }
+def _rouge_from_ids(
+    cand_arr: np.ndarray, cand_counts: Mapping[int, Mapping[int, int]], ref_index: ReferenceIndex
+) -> Dict[str, Dict[str, float]]:
+    return {
+        "rouge-1": _rouge_n_from_counts(cand_counts[1], ref_index.ngrams[1]),
+        "rouge-2": _rouge_n_from_counts(cand_counts[2], ref_index.ngrams[2]),
+        "rouge-l": _rouge_l_from_lcs(_lcs_length_ids(cand_arr, ref_index.ids), len(cand_arr), len(ref_index.ids)),
+    }
 
-    rouge_1 = _rouge_n(candidate_tokens, reference_tokens, 1)
-    rouge_2 = _rouge_n(candidate_tokens, reference_tokens, 2)
-    rouge_l = _rouge_l(candidate_tokens, reference_tokens)
 
-    return {"rouge-1": rouge_1, "rouge-2": rouge_2, "rouge-l": rouge_l}
+def compute_rouge_against(candidate: str, ref_index: ReferenceIndex) -> Dict[str, Dict[str, float]]:
+    """ROUGE-1, ROUGE-2 and ROUGE-L of `candidate` against a prebuilt ReferenceIndex."""
+    cand_tokens = _tokenize_cached(candidate)
+    if not cand_tokens or not ref_index.tokens:
+        return _empty_rouge()
 
+    cand_arr = ref_index.encode(cand_tokens)
+    return _rouge_from_ids(cand_arr, _NgramCounts(cand_arr.tolist(), ref_index.bits), ref_index)
+
+
+def compute_rouge_scores(candidate: str, reference: str) -> Dict[str, Dict[str, float]]:
+    """Compute ROUGE-1, ROUGE-2 and ROUGE-L scores."""
+    return compute_rouge_against(candidate, reference_index(reference))
+
+
+def compute_all_metrics(candidate: str, reference: str, max_n: int = 4, lazy_bigrams: bool = True) -> Dict[str, Any]:
+    """
+    Compute BLEU and ROUGE-1/2/L in one pass: the candidate is tokenized and counted once
+    and scored against the cached ReferenceIndex of `reference`. Identical (candidate, reference)
+    pairs, e.g. the same summary produced by several models, are scored only once per process.
+    """
+    bleu, rouge = _score_pair(candidate, reference, max_n, lazy_bigrams)
+    # Callers get their own dicts so the cached result cannot be mutated through a sample.
+    return {"bleu": bleu, "rouge": {key: dict(scores) for key, scores in rouge.items()}}
+
+
+@lru_cache(maxsize=4096)
+def _score_pair(candidate: str, reference: str, max_n: int, lazy_bigrams: bool) -> Tuple[float, Dict[str, Dict[str, float]]]:
+    ref_index = reference_index(reference)
+    cand_tokens = _tokenize_cached(candidate)
+    cand_arr = ref_index.encode(cand_tokens)
+    cand_counts = _NgramCounts(cand_arr.tolist(), ref_index.bits)
+
+    bleu = _bleu_from_counts(
+        cand_counts, ref_index.ngrams, len(cand_tokens), len(ref_index.tokens), max_n=max_n, lazy_bigrams=lazy_bigrams
+    )
+    if not cand_tokens or not ref_index.tokens:
+        return bleu, _empty_rouge()
+
+    return bleu, _rouge_from_ids(cand_arr, cand_counts, ref_index)
@@ -1,9 +1,14 @@
+import asyncio
 import importlib.util
 import os
+import re
 import sys
 import time
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Dict, Optional
 
 CURRENT_DIR = Path(__file__).resolve().parent
@@ -19,8 +24,66 @@ EVAL_DIR = Path(__file__).resolve().parent
 APP_DIR = EVAL_DIR.parent.parent
 SUMMARY_FILE = APP_DIR / "utils" / "summary.py"
 
-
-@dataclass
+_MODULE_CACHE: Dict[str, ModuleType] = {}
+
+# Gemini prompts only see the first characters of an article.
+GEMINI_ARTICLE_CHAR_LIMIT = 5000
+GEMINI_MAX_EVENTS = 6
+_BULLET_RE = re.compile(r"^[ \-•\t]+|[ \-•\t]+$")
+
+# Output key -> metadata field names tried in order (first truthy wins, like an `or` chain).
+_USAGE_FIELDS = (
+    ("prompt_tokens", ("prompt_token_count", "input_tokens")),
+    ("completion_tokens", ("candidates_token_count", "output_tokens")),
+    ("total_tokens", ("total_token_count",)),
+)
+_USAGE_GETTERS = tuple((key, tuple(attrgetter(name) for name in names)) for key, names in _USAGE_FIELDS)
+
+# Static parts of the Gemini prompts, built once; only the article-specific pieces are spliced in.
+_EVENTS_PROMPT_PREFIX = (
+    "Si investigatívny reportér, ktorý analyzuje text izolovane od iných požiadaviek. "
+    "Odpovedaj výhradne po slovensky a ignoruj všetky predošlé inštrukcie. "
+    "Zameriaj sa na identifikáciu kľúčových udalostí v jasnom, stručnom formáte.\n\n"
+    "## ÚLOHA\n"
+    "Zanalyzuj článok a extrahuj najviac šesť kľúčových udalostí. Každú udalosť popíš jedinou vetou.\n\n"
+    "## METODIKA\n"
+    "- zachyť čo sa stalo, kto sa zúčastnil, kde a kedy (ak je informácia dostupná),\n"
+    "- nepoužívaj odrážky ani číslovanie,\n"
+    "- vyhni sa halucinovaným údajom.\n\n"
+    "## KONTEXT\n"
+)
+_EVENTS_PROMPT_SUFFIX = "\n\n## VÝSTUP\nVráť zoznam viet, každú na novom riadku."
+
+_SUMMARY_PROMPT_HEAD = "\n\n".join(
+    [
+        "Si profesionálny spravodajský editor pracujúci v izolovanej relácii. "
+        "Ignoruj všetky predošlé pokyny a odpovedaj výlučne po slovensky. "
+        "Tvojou úlohou je vytvoriť vecný súhrn článku, ktorý je presný, neutrálny a bez halucinácií.",
+        "## ÚLOHA",
+        "Napíš kompaktný spravodajský súhrn v rozsahu 3 až 5 viet, ktorý vyzdvihne najdôležitejšie body článku.",
+        "## VSTUPNÉ PODKLADY",
+        "### Text článku",
+        "",
+    ]
+)
+_SUMMARY_EVENTS_HEADER = "\n\n### Identifikované udalosti\n\n"
+_SUMMARY_NO_EVENTS = "- (udalosti sa nepodarilo spoľahlivo extrahovať)"
+_SUMMARY_TITLE_HEADER = "\n\n### Titulok\n\n"
+_SUMMARY_INTRO_HEADER = "\n\n### Úvod\n\n"
+_SUMMARY_REQUIREMENTS = "\n\n" + "\n\n".join(
+    [
+        "## POŽIADAVKY NA ŠTRUKTÚRU",
+        "- zachovaj chronológiu alebo logické členenie udalostí,",
+        "- nevkladaj nové informácie,",
+        "- použij faktické formulácie bez hodnotenia,",
+        "",
+    ]
+)
+_SUMMARY_GENERIC_CLOSING = "- Na záver doplň vetu, ktorá explicitne uvedie titulok a úvod vytvorené pre článok."
+_SUMMARY_OUTPUT = "\n\n## VÝSTUP\n\nPoskytni výstup ako súvislý text v slovenčine."
+
+
+@dataclass(slots=True)
 class SummaryOutput:
     text: str
     usage: Dict[str, Any]
@@ -33,9 +96,17 @@ class BaseSummarizer:
     def summarise(self, article: str, title: Optional[str], intro: Optional[str]) -> SummaryOutput:
         raise NotImplementedError
 
+    async def asummarise(self, article: str, title: Optional[str], intro: Optional[str]) -> SummaryOutput:
+        """Async variant; by default runs the blocking `summarise` in a worker thread."""
+        return await asyncio.to_thread(self.summarise, article, title, intro)
+
 
 def _load_summary_module(model_name: str) -> Any:
     os.environ["OPENAI_MODEL"] = model_name
+    cached = _MODULE_CACHE.get(model_name)
+    if cached is not None:
+        return cached
+
     module_name = f"summary_under_test_{model_name.replace('-', '_').replace('.', '_')}"
     spec = importlib.util.spec_from_file_location(module_name, SUMMARY_FILE)
     if spec is None or spec.loader is None:
@@ -46,6 +117,7 @@ def _load_summary_module(model_name: str) -> Any:
     assert loader is not None
     loader.exec_module(module)  # type: ignore[attr-defined]
     sys.modules[module_name] = module
+    _MODULE_CACHE[model_name] = module
     return module
 
 
@@ -92,12 +164,12 @@ class OpenAISummarizer(BaseSummarizer):
             return
 
         completions = self.summary_module.client.beta.chat.completions
-        original_parse = getattr(completions, "_original_parse", None) or completions.parse
-
         if getattr(completions, "_temperature_override_active", False):
             # Already patched, nothing to do.
             return
 
+        original_parse = getattr(completions, "_original_parse", None) or completions.parse
+
         def patched_parse(*args: Any, **kwargs: Any) -> Any:
             if "temperature" in kwargs and kwargs["temperature"] != 1:
                 kwargs = dict(kwargs)
@@ -131,10 +203,33 @@ class GeminiSummarizer(BaseSummarizer):
 
     def summarise(self, article: str, title: Optional[str], intro: Optional[str]) -> SummaryOutput:
         start = time.perf_counter()
+        article = article[:GEMINI_ARTICLE_CHAR_LIMIT]
         events, events_usage, events_duration = self._extract_events(article)
         summary_text, summary_usage, summary_duration = self._generate_summary(article, events, title, intro)
         wall_time = time.perf_counter() - start
+        return self._build_output(summary_text, events_usage, summary_usage, events_duration + summary_duration, wall_time)
+
+    async def asummarise(self, article: str, title: Optional[str], intro: Optional[str]) -> SummaryOutput:
+        start = time.perf_counter()
+        article = article[:GEMINI_ARTICLE_CHAR_LIMIT]
+        response, events_usage, events_duration = await self._call_gemini_async(self._events_prompt(article), temperature=0.2)
+        events = self._parse_events(response)
+        response, summary_usage, summary_duration = await self._call_gemini_async(
+            self._summary_prompt(article, events, title, intro), temperature=0.4
+        )
+        wall_time = time.perf_counter() - start
+        return self._build_output(
+            self._response_text(response), events_usage, summary_usage, events_duration + summary_duration, wall_time
+        )
 
+    def _build_output(
+        self,
+        summary_text: str,
+        events_usage: Dict[str, Any],
+        summary_usage: Dict[str, Any],
+        api_duration: float,
+        wall_time: float,
+    ) -> SummaryOutput:
         usage = self._merge_usage(events_usage, summary_usage)
         if "total_tokens" not in usage and all(isinstance(usage.get(key), (int, float)) for key in ("prompt_tokens", "completion_tokens")):
             usage["total_tokens"] = usage.get("prompt_tokens", 0) + usage.get("completion_tokens", 0)
@@ -142,50 +237,58 @@ class GeminiSummarizer(BaseSummarizer):
             {
                 "provider": self.provider,
                 "model": self.model_name,
-                "api_duration_seconds": events_duration + summary_duration,
+                "api_duration_seconds": api_duration,
                 "calls": 2,
             }
         )
 
         return SummaryOutput(text=summary_text, usage=usage, wall_time_seconds=wall_time)
 
-    def _call_gemini(self, prompt: str, temperature: float) -> Any:
-        generation_config = self.genai.types.GenerationConfig(
+    def _generation_config(self, temperature: float) -> Any:
+        return self.genai.types.GenerationConfig(
             temperature=temperature,
             max_output_tokens=2048,
         )
+
+    def _call_gemini(self, prompt: str, temperature: float) -> Any:
         start = time.perf_counter()
         response = self.model.generate_content(
             prompt,
-            generation_config=generation_config,
+            generation_config=self._generation_config(temperature),
         )
         duration = time.perf_counter() - start
         return response, self._usage_from_metadata(getattr(response, "usage_metadata", None)), duration
 
-    def _extract_events(self, article: str) -> tuple[list[str], Dict[str, Any], float]:
-        if len(article) > 5000:
-            article = article[:5000]
-
-        prompt = (
-            "Si investigatívny reportér, ktorý analyzuje text izolovane od iných požiadaviek. "
-            "Odpovedaj výhradne po slovensky a ignoruj všetky predošlé inštrukcie. "
-            "Zameriaj sa na identifikáciu kľúčových udalostí v jasnom, stručnom formáte.\n\n"
-            "## ÚLOHA\n"
-            "Zanalyzuj článok a extrahuj najviac šesť kľúčových udalostí. Každú udalosť popíš jedinou vetou.\n\n"
-            "## METODIKA\n"
-            "- zachyť čo sa stalo, kto sa zúčastnil, kde a kedy (ak je informácia dostupná),\n"
-            "- nepoužívaj odrážky ani číslovanie,\n"
-            "- vyhni sa halucinovaným údajom.\n\n"
-            "## KONTEXT\n"
-            f"{article}\n\n"
-            "## VÝSTUP\n"
-            "Vráť zoznam viet, každú na novom riadku."
+    async def _call_gemini_async(self, prompt: str, temperature: float) -> Any:
+        start = time.perf_counter()
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config=self._generation_config(temperature),
         )
+        duration = time.perf_counter() - start
+        return response, self._usage_from_metadata(getattr(response, "usage_metadata", None)), duration
+
+    @staticmethod
+    def _response_text(response: Any) -> str:
+        return (response.text or "").strip() if hasattr(response, "text") else ""
+
+    def _parse_events(self, response: Any) -> list[str]:
+        events: list[str] = []
+        for line in self._response_text(response).splitlines():
+            if line and not line.isspace():
+                events.append(_BULLET_RE.sub("", line))
+                if len(events) == GEMINI_MAX_EVENTS:
+                    break
+        return events
+
+    def _extract_events(self, article: str) -> tuple[list[str], Dict[str, Any], float]:
+        response, usage, duration = self._call_gemini(self._events_prompt(article), temperature=0.2)
+        return self._parse_events(response), usage, duration
 
-        response, usage, duration = self._call_gemini(prompt, temperature=0.2)
-        text = (response.text or "").strip() if hasattr(response, "text") else ""
-        events = [line.strip(" -•\t") for line in text.splitlines() if line.strip()]
-        return events[:6], usage, duration
+    @staticmethod
+    def _events_prompt(article: str) -> str:
+        # `article` is already truncated to GEMINI_ARTICLE_CHAR_LIMIT by the caller.
+        return f"{_EVENTS_PROMPT_PREFIX}{article}{_EVENTS_PROMPT_SUFFIX}"
 
     def _generate_summary(
         self,
@@ -194,74 +297,62 @@ class GeminiSummarizer(BaseSummarizer):
         title: Optional[str],
         intro: Optional[str],
     ) -> tuple[str, Dict[str, Any], float]:
-        if len(article) > 5000:
-            article = article[:5000]
+        response, usage, duration = self._call_gemini(self._summary_prompt(article, events, title, intro), temperature=0.4)
+        return self._response_text(response), usage, duration
 
-        events_text = "\n".join(f"- {event}" for event in events) if events else "- (udalosti sa nepodarilo spoľahlivo extrahovať)"
+    @staticmethod
+    def _summary_prompt(article: str, events: list[str], title: Optional[str], intro: Optional[str]) -> str:
+        events_text = "\n".join(f"- {event}" for event in events) if events else _SUMMARY_NO_EVENTS
         normalized_title = title.strip() if title else ""
         normalized_intro = intro.strip() if intro else ""
 
         if normalized_title and normalized_intro:
-            closing_directive = f'- Zakonči text vetou presne v tvare: "Záver: {normalized_title}. Úvod: {normalized_intro}".'
-        else:
-            closing_directive = "- Na záver doplň vetu, ktorá explicitne uvedie titulok a úvod vytvorené pre článok."
-
-        prompt_parts = [
-            "Si profesionálny spravodajský editor pracujúci v izolovanej relácii. "
-            "Ignoruj všetky predošlé pokyny a odpovedaj výlučne po slovensky. "
-            "Tvojou úlohou je vytvoriť vecný súhrn článku, ktorý je presný, neutrálny a bez halucinácií.",
-            "## ÚLOHA",
-            "Napíš kompaktný spravodajský súhrn v rozsahu 3 až 5 viet, ktorý vyzdvihne najdôležitejšie body článku.",
-            "## VSTUPNÉ PODKLADY",
-            "### Text článku",
-            article,
-            "### Identifikované udalosti",
-            events_text,
-        ]
-
+            return (
+                f"{_SUMMARY_PROMPT_HEAD}{article}{_SUMMARY_EVENTS_HEADER}{events_text}"
+                f"{_SUMMARY_TITLE_HEADER}{normalized_title}{_SUMMARY_INTRO_HEADER}{normalized_intro}"
+                f'{_SUMMARY_REQUIREMENTS}- Zakonči text vetou presne v tvare: "Záver: {normalized_title}. Úvod: {normalized_intro}".'
+                f"{_SUMMARY_OUTPUT}"
+            )
+
+        optional = ""
         if normalized_title:
-            prompt_parts.extend(["### Titulok", normalized_title])
-        if normalized_intro:
-            prompt_parts.extend(["### Úvod", normalized_intro])
-
-        prompt_parts.extend(
-            [
-                "## POŽIADAVKY NA ŠTRUKTÚRU",
-                "- zachovaj chronológiu alebo logické členenie udalostí,",
-                "- nevkladaj nové informácie,",
-                "- použij faktické formulácie bez hodnotenia,",
-                closing_directive,
-                "## VÝSTUP",
-                "Poskytni výstup ako súvislý text v slovenčine.",
-            ]
+            optional = f"{_SUMMARY_TITLE_HEADER}{normalized_title}"
+        elif normalized_intro:
+            optional = f"{_SUMMARY_INTRO_HEADER}{normalized_intro}"
+        return (
+            f"{_SUMMARY_PROMPT_HEAD}{article}{_SUMMARY_EVENTS_HEADER}{events_text}"
+            f"{optional}{_SUMMARY_REQUIREMENTS}{_SUMMARY_GENERIC_CLOSING}{_SUMMARY_OUTPUT}"
         )
 
-        prompt = "\n\n".join(prompt_parts)
-        response, usage, duration = self._call_gemini(prompt, temperature=0.4)
-        summary_text = (response.text or "").strip() if hasattr(response, "text") else ""
-        return summary_text, usage, duration
-
     @staticmethod
     def _usage_from_metadata(metadata: Any) -> Dict[str, Any]:
         if metadata is None:
             return {}
 
-        if isinstance(metadata, dict):
-            prompt_tokens = metadata.get("prompt_token_count") or metadata.get("input_tokens")
-            completion_tokens = metadata.get("candidates_token_count") or metadata.get("output_tokens")
-            total_tokens = metadata.get("total_token_count")
-        else:
-            prompt_tokens = getattr(metadata, "prompt_token_count", None) or getattr(metadata, "input_tokens", None)
-            completion_tokens = getattr(metadata, "candidates_token_count", None) or getattr(metadata, "output_tokens", None)
-            total_tokens = getattr(metadata, "total_token_count", None)
-
         usage = {}
-        if prompt_tokens is not None:
-            usage["prompt_tokens"] = prompt_tokens
-        if completion_tokens is not None:
-            usage["completion_tokens"] = completion_tokens
-        if total_tokens is not None:
-            usage["total_tokens"] = total_tokens
+        if isinstance(metadata, dict):
+            get = metadata.get
+            for key, names in _USAGE_FIELDS:
+                value = None
+                for name in names:
+                    value = get(name)
+                    if value:
+                        break
+                if value is not None:
+                    usage[key] = value
+            return usage
+
+        for key, getters in _USAGE_GETTERS:
+            value = None
+            for getter in getters:
+                try:
+                    value = getter(metadata)
+                except AttributeError:
+                    value = None
+                if value:
+                    break
+            if value is not None:
+                usage[key] = value
         return usage
 
     @staticmethod
@@ -296,7 +387,10 @@ def parse_model_spec(spec: str) -> tuple[str, str]:
     return provider, model
 
 
+@lru_cache(maxsize=None)
 def get_summarizer(provider: str, model_name: str) -> BaseSummarizer:
+    # One summarizer per (provider, model): repeated specs reuse the configured client and its
+    # connection pool. OpenAI summarizers already share the single pooled client of app.utils.summary.
     if provider == "openai":
         return OpenAISummarizer(model_name)
     if provider == "gemini":
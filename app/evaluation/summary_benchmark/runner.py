@@ -1,25 +1,44 @@
 import argparse
+import asyncio
 import json
 import sys
-from dataclasses import dataclass, field
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from queue import Full, Queue
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, TypeVar
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; results are then written with the stdlib encoder.
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # ijson is optional; without it the dataset file is decoded in one go.
+    ijson = None
 
 CURRENT_DIR = Path(__file__).resolve().parent
 
 if __package__ in (None, ""):
     sys.path.append(str(CURRENT_DIR))
-    from metrics import compute_bleu, compute_rouge_scores  # type: ignore
-    from providers import SummaryOutput, get_summarizer, parse_model_spec  # type: ignore
+    from metrics import compute_all_metrics  # type: ignore
+    from providers import BaseSummarizer, SummaryOutput, get_summarizer, parse_model_spec  # type: ignore
 else:
-    from .metrics import compute_bleu, compute_rouge_scores
-    from .providers import SummaryOutput, get_summarizer, parse_model_spec
+    from .metrics import compute_all_metrics
+    from .providers import BaseSummarizer, SummaryOutput, get_summarizer, parse_model_spec
 
 EVAL_DIR = CURRENT_DIR
 DEFAULT_DATASET = EVAL_DIR / "datasets" / "sample_dataset.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class SampleResult:
     article_id: str
     summary: str
@@ -30,46 +49,58 @@ class SampleResult:
     meta: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelResult:
     provider: str
     model: str
-    samples: List[SampleResult] = field(default_factory=list)
+    # Field order is the key order of the JSON report (aggregates before the per-sample details).
     aggregate_metrics: Dict[str, Any] = field(default_factory=dict)
     aggregate_usage: Dict[str, Any] = field(default_factory=dict)
+    samples: List[SampleResult] = field(default_factory=list)
 
 
 def load_dataset(dataset_path: Path, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    return list(iter_dataset(dataset_path, limit=limit))
+
+
+def iter_dataset(dataset_path: Path, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Yield normalised dataset items one at a time, parsing the file incrementally when ijson is installed."""
     if not dataset_path.exists():
         raise FileNotFoundError(f"Dataset not found: {dataset_path}")
-
-    with dataset_path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
-
-    if not isinstance(payload, list):
-        raise ValueError("Dataset must be a list of objects.")
-
-    if limit is not None:
-        payload = payload[:limit]
-
-    normalised = []
-    for idx, item in enumerate(payload):
-        if not isinstance(item, dict):
-            raise ValueError(f"Dataset item at index {idx} is not an object.")
-        article = item.get("article") or item.get("text")
-        if not article:
-            raise ValueError(f"Dataset item at index {idx} is missing 'article' text.")
-        normalised.append(
-            {
-                "id": str(item.get("id") or idx),
-                "article": article,
-                "reference_summary": item.get("reference_summary") or item.get("reference") or item.get("golden_summary"),
-                "title": item.get("title"),
-                "intro": item.get("intro"),
-                "meta": _build_meta(item),
-            }
-        )
-    return normalised
+    return _iter_normalised(dataset_path, limit)
+
+
+def _iter_normalised(dataset_path: Path, limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+    with dataset_path.open("rb") as handle:
+        if ijson is not None:
+            events = ijson.parse(handle, use_float=True)
+            first = next(events, None)
+            if first is None or first[1] != "start_array":
+                raise ValueError("Dataset must be a list of objects.")
+            payload: Iterable[Any] = ijson.items(chain((first,), events), "item")
+        else:
+            payload = json.load(handle)
+            if not isinstance(payload, list):
+                raise ValueError("Dataset must be a list of objects.")
+
+        for idx, item in enumerate(islice(payload, limit)):
+            yield _normalise_item(idx, item)
+
+
+def _normalise_item(idx: int, item: Any) -> Dict[str, Any]:
+    if not isinstance(item, dict):
+        raise ValueError(f"Dataset item at index {idx} is not an object.")
+    article = item.get("article") or item.get("text")
+    if not article:
+        raise ValueError(f"Dataset item at index {idx} is missing 'article' text.")
+    return {
+        "id": str(item.get("id") or idx),
+        "article": article,
+        "reference_summary": item.get("reference_summary") or item.get("reference") or item.get("golden_summary"),
+        "title": item.get("title"),
+        "intro": item.get("intro"),
+        "meta": _build_meta(item),
+    }
 
 
 def _build_meta(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -106,58 +137,167 @@ def _accumulate_usage(aggregate: Dict[str, Any], usage: Dict[str, Any], wall_tim
     aggregate["wall_time_seconds"] += wall_time
 
 
-def evaluate_model(provider: str, model_name: str, dataset: List[Dict[str, Any]]) -> ModelResult:
-    summarizer = get_summarizer(provider, model_name)
-    model_result = ModelResult(provider=provider, model=model_name)
+T = TypeVar("T")
+_PREFETCH_DONE = object()
+
+
+class _PrefetchError:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+def _prefetch(iterable: Iterable[T], buffer_size: int) -> Iterator[T]:
+    """Drive `iterable` on a background thread, keeping up to `buffer_size` items ready."""
+    queue: "Queue[Any]" = Queue(maxsize=buffer_size)
+    # Set when the consumer stops early, so the producer never blocks on a full queue forever.
+    stop = threading.Event()
+
+    def put(value: Any) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(value, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for value in iterable:
+                if not put(value):
+                    return
+        except BaseException as exc:  # re-raised on the consumer side
+            put(_PrefetchError(exc))
+        finally:
+            put(_PREFETCH_DONE)
+
+    producer = threading.Thread(target=produce, name="summary-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            value = queue.get()
+            if value is _PREFETCH_DONE:
+                return
+            if isinstance(value, _PrefetchError):
+                raise value.exc
+            yield value
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _build_sample(item: Dict[str, Any], summary_output: SummaryOutput) -> SampleResult:
+    return SampleResult(
+        article_id=item["id"],
+        summary=summary_output.text,
+        reference_summary=item.get("reference_summary"),
+        metrics={},
+        usage=summary_output.usage,
+        wall_time_seconds=summary_output.wall_time_seconds,
+        meta=item.get("meta"),
+    )
 
-    bleu_scores: List[float] = []
-    rouge_scores: Dict[str, List[float]] = {"rouge-1": [], "rouge-2": [], "rouge-l": []}
-    aggregate_usage = _initial_usage(provider, model_name)
 
-    for item in dataset:
-        article_id = item["id"]
-        text = item["article"]
-        reference = item.get("reference_summary")
-        title = item.get("title")
-        intro = item.get("intro")
-
-        summary_output: SummaryOutput = summarizer.summarise(text, title=title, intro=intro)
-        summary_text = summary_output.text
-        usage_snapshot = summary_output.usage
-        wall_clock = summary_output.wall_time_seconds
-
-        _accumulate_usage(aggregate_usage, usage_snapshot, wall_clock)
-
-        metric_payload: Dict[str, Any] = {}
-        if reference:
-            bleu = compute_bleu(summary_text, reference)
-            rouge = compute_rouge_scores(summary_text, reference)
-            metric_payload = {"bleu": bleu, "rouge": rouge}
-            bleu_scores.append(bleu)
-            for rouge_key, value in rouge.items():
-                rouge_scores[rouge_key].append(value["f1"])
-
-        model_result.samples.append(
-            SampleResult(
-                article_id=article_id,
-                summary=summary_text,
-                reference_summary=reference,
-                metrics=metric_payload,
-                usage=usage_snapshot,
-                wall_time_seconds=wall_clock,
-                meta=item.get("meta"),
-            )
-        )
+async def _summarise_all(
+    summarizer: BaseSummarizer, dataset: List[Dict[str, Any]], max_concurrency: int
+) -> List[SummaryOutput]:
+    # Bounded so a large dataset stays under the provider's requests-per-minute quota.
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # Blocking summarizers run through asyncio.to_thread; size its pool to the semaphore so the
+    # default executor (min(32, cpu_count + 4) threads) does not cap the requested concurrency.
+    # asyncio.run shuts the executor down when the loop finishes.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="summarise")
+    )
+
+    async def run(item: Dict[str, Any]) -> SummaryOutput:
+        async with semaphore:
+            return await summarizer.asummarise(item["article"], title=item.get("title"), intro=item.get("intro"))
+
+    outputs = await asyncio.gather(*(run(item) for item in dataset), return_exceptions=True)
+    for output in outputs:
+        if isinstance(output, BaseException):
+            raise output
+    return outputs  # type: ignore[return-value]
+
+
+_METRIC_COLUMNS = ("bleu", "rouge-1", "rouge-2", "rouge-l")
+
+
+def _aggregate_metrics(samples: List[SampleResult]) -> Dict[str, Any]:
+    # One row per sample ([bleu, rouge-1 f1, rouge-2 f1, rouge-l f1]); NaN marks unscored samples.
+    scores = np.full((len(samples), len(_METRIC_COLUMNS)), np.nan)
+    for row, sample in enumerate(samples):
+        if sample.metrics:
+            rouge = sample.metrics["rouge"]
+            scores[row] = (sample.metrics["bleu"], rouge["rouge-1"]["f1"], rouge["rouge-2"]["f1"], rouge["rouge-l"]["f1"])
+
+    scored = ~np.isnan(scores)
+    counts = scored.sum(axis=0)
+    means = np.where(scored, scores, 0.0).sum(axis=0) / np.maximum(counts, 1)
 
     aggregate_metrics: Dict[str, Any] = {}
-    if bleu_scores:
-        aggregate_metrics["mean_bleu"] = sum(bleu_scores) / len(bleu_scores)
-    if any(rouge_scores.values()):
+    if counts[0]:
+        aggregate_metrics["mean_bleu"] = float(means[0])
+    if counts[1:].any():
         aggregate_metrics["mean_rouge_f1"] = {
-            key: (sum(values) / len(values) if values else None) for key, values in rouge_scores.items()
+            key: (float(means[col]) if counts[col] else None)
+            for col, key in enumerate(_METRIC_COLUMNS)
+            if col > 0
         }
+    return aggregate_metrics
 
-    model_result.aggregate_metrics = aggregate_metrics
+
+def evaluate_model(
+    provider: str,
+    model_name: str,
+    dataset: Iterable[Dict[str, Any]],
+    max_concurrency: int = 1,
+    metric_workers: int = 1,
+    prefetch: int = 1,
+) -> ModelResult:
+    summarizer = get_summarizer(provider, model_name)
+    model_result = ModelResult(provider=provider, model=model_name)
+    aggregate_usage = _initial_usage(provider, model_name)
+
+    summarised: Iterable[Tuple[Dict[str, Any], SummaryOutput]]
+    if max_concurrency > 1:
+        items = list(dataset)
+        summarised = zip(items, asyncio.run(_summarise_all(summarizer, items, max_concurrency)))
+    else:
+        # Items are pulled from `dataset` one at a time, so a streamed dataset is never fully resident.
+        summarised = (
+            (item, summarizer.summarise(item["article"], title=item.get("title"), intro=item.get("intro")))
+            for item in dataset
+        )
+        if prefetch > 0:
+            # The next API call is already in flight while the current summary is scored.
+            summarised = _prefetch(summarised, prefetch)
+
+    # With metric_workers > 1, scoring runs in a thread pool while later articles are still being summarised.
+    executor = ThreadPoolExecutor(max_workers=metric_workers) if metric_workers > 1 else None
+    pending: List[Tuple[SampleResult, "Future[Dict[str, Any]]"]] = []
+    try:
+        for item, summary_output in summarised:
+            # Usage is accumulated here on the calling thread only, never from the workers.
+            _accumulate_usage(aggregate_usage, summary_output.usage, summary_output.wall_time_seconds)
+
+            sample = _build_sample(item, summary_output)
+            if sample.reference_summary:
+                if executor is not None:
+                    future = executor.submit(compute_all_metrics, sample.summary, sample.reference_summary)
+                    pending.append((sample, future))
+                else:
+                    sample.metrics = compute_all_metrics(sample.summary, sample.reference_summary)
+            model_result.samples.append(sample)
+
+        for sample, future in pending:
+            sample.metrics = future.result()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    model_result.aggregate_metrics = _aggregate_metrics(model_result.samples)
     model_result.aggregate_usage = aggregate_usage
     return model_result
 
@@ -212,29 +352,23 @@ def print_model_report(result: ModelResult, verbose: bool = False) -> None:
 
 
 def serialise_results(results: List[ModelResult]) -> List[Dict[str, Any]]:
-    payload = []
-    for model_result in results:
-        payload.append(
-            {
-                "provider": model_result.provider,
-                "model": model_result.model,
-                "aggregate_metrics": model_result.aggregate_metrics,
-                "aggregate_usage": model_result.aggregate_usage,
-                "samples": [
-                    {
-                        "article_id": sample.article_id,
-                        "summary": sample.summary,
-                        "reference_summary": sample.reference_summary,
-                        "metrics": sample.metrics,
-                        "usage": sample.usage,
-                        "wall_time_seconds": sample.wall_time_seconds,
-                        "meta": sample.meta,
-                    }
-                    for sample in model_result.samples
-                ],
-            }
-        )
-    return payload
+    return [asdict(model_result) for model_result in results]
+
+
+def _dumps(model_result: ModelResult) -> str:
+    if orjson is not None:
+        # orjson serialises (slotted) dataclasses natively, without an intermediate dict.
+        return orjson.dumps(model_result, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(asdict(model_result), ensure_ascii=False, indent=2)
+
+
+def write_results(results: Iterable[ModelResult], handle: TextIO) -> None:
+    """Stream the JSON report one model at a time instead of building the whole document first."""
+    handle.write("[")
+    for index, model_result in enumerate(results):
+        handle.write(",\n" if index else "\n")
+        handle.write(_dumps(model_result))
+    handle.write("\n]\n")
 
 
 def parse_args() -> argparse.Namespace:
@@ -270,26 +404,52 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print per-sample metric and usage details.",
     )
+    parser.add_argument(
+        "--workers",
+        "--concurrency",
+        dest="workers",
+        type=int,
+        default=None,
+        help="Number of articles summarised concurrently per model (default: 8; 1 = sequential, streams the dataset).",
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=1,
+        help="Summaries requested ahead of scoring when running sequentially (default: 1; 0 disables).",
+    )
+    parser.add_argument(
+        "--metric-workers",
+        type=int,
+        default=1,
+        help="Threads used to score summaries (default: 1, inline).",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    dataset = load_dataset(args.dataset, limit=args.limit)
-
     results: List[ModelResult] = []
     model_specs: List[Tuple[str, str]] = [parse_model_spec(spec) for spec in args.models]
+    workers = args.workers if args.workers is not None else 8
     for provider, model_name in model_specs:
-        model_result = evaluate_model(provider, model_name, dataset)
+        model_result = evaluate_model(
+            provider,
+            model_name,
+            # Re-read per model so the dataset is streamed instead of held across the whole run.
+            iter_dataset(args.dataset, limit=args.limit),
+            max_concurrency=workers,
+            metric_workers=args.metric_workers,
+            prefetch=args.prefetch,
+        )
         print_model_report(model_result, verbose=args.verbose)
         print()
         results.append(model_result)
 
     if args.output:
-        serialised = serialise_results(results)
         args.output.parent.mkdir(parents=True, exist_ok=True)
         with args.output.open("w", encoding="utf-8") as handle:
-            json.dump(serialised, handle, ensure_ascii=False, indent=2)
+            write_results(results, handle)
         print(f"Detailed results written to {args.output}")
 
 
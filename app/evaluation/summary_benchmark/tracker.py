@@ -1,9 +1,17 @@
+import json
+import threading
 import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+try:
+    import httpx
+except ImportError:
+    # httpx ships with the OpenAI SDK; without it the tracker falls back to wrapping `parse`.
+    httpx = None
 
-@dataclass
+
+@dataclass(slots=True)
 class CallUsage:
     prompt_tokens: Optional[int]
     completion_tokens: Optional[int]
@@ -13,50 +21,85 @@ class CallUsage:
     response_format: Any
 
 
+# The tracker active on each thread; the installed response hook (or parse wrapper) reports to it.
+_active = threading.local()
+
+
 @dataclass
 class UsageTracker:
     summary_module: Any
     calls: List[CallUsage] = field(default_factory=list)
-    _original_parse: Optional[Any] = field(init=False, default=None)
+    _previous: Optional["UsageTracker"] = field(init=False, default=None)
 
     def __post_init__(self) -> None:
         try:
-            self._completions = self.summary_module.client.beta.chat.completions
-            self._original_parse = self._completions.parse
+            client = self.summary_module.client
+            self._completions = client.beta.chat.completions
+            self._completions.parse
         except AttributeError as exc:
             raise RuntimeError(
                 "The provided summary module does not expose the expected OpenAI client structure."
             ) from exc
+        self._http_client = getattr(client, "_client", None)
 
     def __enter__(self) -> "UsageTracker":
-        def wrapped_parse(*args: Any, **kwargs: Any) -> Any:
-            start = time.perf_counter()
-            response = self._original_parse(*args, **kwargs)
-            duration = time.perf_counter() - start
-            usage = getattr(response, "usage", None)
-            self.calls.append(
-                CallUsage(
-                    prompt_tokens=getattr(usage, "prompt_tokens", None),
-                    completion_tokens=getattr(usage, "completion_tokens", None),
-                    total_tokens=getattr(usage, "total_tokens", None),
-                    duration_seconds=duration,
-                    model=kwargs.get("model"),
-                    response_format=kwargs.get("response_format"),
-                )
-            )
-            return response
-
-        self._completions.parse = wrapped_parse
+        if httpx is not None and isinstance(self._http_client, httpx.Client):
+            _install_response_hook(self._http_client)
+        else:
+            _install_dispatch(self._completions)
+        self._previous = getattr(_active, "tracker", None)
+        _active.tracker = self
         return self
 
     def __exit__(self, exc_type, exc, exc_tb) -> None:
-        self._completions.parse = self._original_parse
+        _active.tracker = self._previous
+
+    def _record(self, parse: Any, args: Any, kwargs: Dict[str, Any]) -> Any:
+        start = time.perf_counter()
+        response = parse(*args, **kwargs)
+        duration = time.perf_counter() - start
+        usage = getattr(response, "usage", None)
+        self.calls.append(
+            CallUsage(
+                prompt_tokens=getattr(usage, "prompt_tokens", None),
+                completion_tokens=getattr(usage, "completion_tokens", None),
+                total_tokens=getattr(usage, "total_tokens", None),
+                duration_seconds=duration,
+                model=kwargs.get("model"),
+                response_format=kwargs.get("response_format"),
+            )
+        )
+        return response
+
+    def _record_response(self, response: "httpx.Response") -> None:
+        # Failed attempts that the SDK retries are not billed completions.
+        if not response.is_success or not response.request.url.path.endswith("/chat/completions"):
+            return
+        response.read()
+        try:
+            usage = response.json().get("usage") or {}
+            request = json.loads(response.request.content or b"{}")
+        except ValueError:
+            return
+        self.calls.append(
+            CallUsage(
+                prompt_tokens=usage.get("prompt_tokens"),
+                completion_tokens=usage.get("completion_tokens"),
+                total_tokens=usage.get("total_tokens"),
+                duration_seconds=response.elapsed.total_seconds(),
+                model=request.get("model"),
+                response_format=request.get("response_format"),
+            )
+        )
 
     def aggregate(self) -> Dict[str, float]:
-        prompt = sum(call.prompt_tokens or 0 for call in self.calls)
-        completion = sum(call.completion_tokens or 0 for call in self.calls)
-        total = sum(call.total_tokens or 0 for call in self.calls)
-        duration = sum(call.duration_seconds for call in self.calls)
+        prompt = completion = total = 0
+        duration = 0.0
+        for call in self.calls:
+            prompt += call.prompt_tokens or 0
+            completion += call.completion_tokens or 0
+            total += call.total_tokens or 0
+            duration += call.duration_seconds
         return {
             "prompt_tokens": prompt,
             "completion_tokens": completion,
@@ -65,3 +108,44 @@ class UsageTracker:
             "calls": len(self.calls),
         }
 
+
+_install_lock = threading.Lock()
+
+
+def _dispatch_response(response: "httpx.Response") -> None:
+    tracker = getattr(_active, "tracker", None)
+    if tracker is not None:
+        tracker._record_response(response)
+
+
+def _install_response_hook(http_client: "httpx.Client") -> None:
+    """
+    Register a response event hook on the OpenAI client's httpx transport once. Usage and
+    timing are read from the HTTP response, so `parse` itself stays unwrapped.
+    """
+    with _install_lock:
+        hooks = http_client.event_hooks
+        if _dispatch_response in hooks["response"]:
+            return
+        hooks["response"].append(_dispatch_response)
+        http_client.event_hooks = hooks
+
+
+def _install_dispatch(completions: Any) -> None:
+    """
+    Wrap `completions.parse` once with a dispatcher that records into the calling thread's
+    tracker, so summaries running on different threads can be tracked concurrently.
+    """
+    with _install_lock:
+        if getattr(completions, "_usage_dispatch_installed", False):
+            return
+        parse = completions.parse
+
+        def dispatch_parse(*args: Any, **kwargs: Any) -> Any:
+            tracker = getattr(_active, "tracker", None)
+            if tracker is None:
+                return parse(*args, **kwargs)
+            return tracker._record(parse, args, kwargs)
+
+        completions.parse = dispatch_parse
+        completions._usage_dispatch_installed = True
@@ -1,12 +1,21 @@
 import hmac
 import os
+from typing import Iterable, Optional
 
-from flask import jsonify, request
+from flask import Blueprint, jsonify, request
 
 ADMIN_TOKEN_ENV_NAME = "PROCESSING_ADMIN_TOKEN"
 ADMIN_TOKEN_HEADER = "X-Processing-Token"
 
 
+def _load_expected_token() -> bytes:
+    return os.getenv(ADMIN_TOKEN_ENV_NAME, "").strip().encode()
+
+
+# Read once at import; app/__init__ loads .env before it imports the routes.
+_EXPECTED_TOKEN_BYTES = _load_expected_token()
+
+
 def _extract_admin_token() -> str:
     bearer = request.headers.get("Authorization", "").strip()
     if bearer.lower().startswith("bearer "):
@@ -16,7 +25,7 @@ def _extract_admin_token() -> str:
 
 
 def require_processing_admin():
-    expected_token = os.getenv(ADMIN_TOKEN_ENV_NAME, "").strip()
+    expected_token = _EXPECTED_TOKEN_BYTES
     if not expected_token:
         return (
             jsonify(
@@ -31,8 +40,24 @@ def require_processing_admin():
         )
 
     provided_token = _extract_admin_token()
-    if not provided_token or not hmac.compare_digest(provided_token, expected_token):
+    if not provided_token or not hmac.compare_digest(provided_token.encode(), expected_token):
         return jsonify({"error": "Unauthorized"}), 403
 
     return None
 
+
+def guard_blueprint(blueprint: Blueprint, endpoints: Optional[Iterable[str]] = None) -> None:
+    """
+    Run `require_processing_admin` once per request, before the view, for every endpoint of
+    `blueprint` or only the given endpoint names (e.g. "articles.fact_check_article").
+    """
+    guarded = frozenset(endpoints) if endpoints is not None else None
+
+    @blueprint.before_request
+    def _require_processing_admin():
+        # CORS preflights carry no credentials; Flask answers them without entering the view.
+        if request.method == "OPTIONS":
+            return None
+        if guarded is not None and request.endpoint not in guarded:
+            return None
+        return require_processing_admin()
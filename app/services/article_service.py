@@ -1,10 +1,11 @@
 import logging
-import json
 import re
 import unicodedata
 from typing import Dict, List, Optional
 
+import orjson
 from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
 
 from data.db import SessionLocal
 
@@ -14,9 +15,9 @@ def _parse_json_field(value):
         return None
     if isinstance(value, (dict, list)):
         return value
-    if isinstance(value, str):
+    if isinstance(value, (str, bytes)):
         try:
-            return json.loads(value)
+            return orjson.loads(value)
         except Exception:
             return None
     return None
@@ -42,7 +43,8 @@ def fetch_articles(limit: Optional[int], offset: Optional[int]) -> List[Dict]:
             query += " OFFSET :offset"
             params["offset"] = offset
 
-        result = session.execute(text(query), params)
+        # Stream rows from a server-side cursor instead of materialising them with fetchall().
+        result = session.execute(text(query), params, execution_options={"yield_per": 500})
         return [
             {
                 "id": str(row[0]) if row[0] else None,
@@ -57,7 +59,7 @@ def fetch_articles(limit: Optional[int], offset: Optional[int]) -> List[Dict]:
                 "fact_check_results": _parse_json_field(row[9]),
                 "summary_annotations": _parse_json_field(row[10]),
             }
-            for row in result.fetchall()
+            for row in result
         ]
     except Exception as exc:
         session.rollback()
@@ -71,6 +73,10 @@ def get_article_details_by_slug(article_slug: str) -> Optional[Dict]:
     """Return article details that match the provided slug-alike string."""
     session = SessionLocal()
     try:
+        exact_article = _match_by_title_slug(session, article_slug)
+        if exact_article:
+            return exact_article
+
         query = """
             SELECT id, title, intro, summary, url, category, tags, top_image, scraped_at,
                    fact_check_results, summary_annotations
@@ -118,10 +124,41 @@ def _row_to_article_dict(row, article_slug: str) -> Dict:
     }
 
 
+# Cleared once the title_slug column (data/migrations/add_title_slug.sql) turns out to be missing.
+_title_slug_column_available = True
+
+
+def _match_by_title_slug(session, article_slug: str) -> Optional[Dict]:
+    """Exact, index-backed match on the generated articles.title_slug column."""
+    global _title_slug_column_available
+
+    if not _title_slug_column_available:
+        return None
+
+    indexed_query = """
+        SELECT id, title, intro, summary, url, category, tags, top_image, scraped_at,
+               fact_check_results, summary_annotations
+        FROM articles
+        WHERE title_slug = :slug
+        ORDER BY scraped_at DESC
+        LIMIT 1
+    """
+    try:
+        row = session.execute(text(indexed_query), {"slug": _normalise_slug(article_slug)}).fetchone()
+    except ProgrammingError:
+        session.rollback()
+        _title_slug_column_available = False
+        logging.warning("articles.title_slug is missing; falling back to scanning recent titles.")
+        return None
+    return _row_to_article_dict(row, article_slug) if row else None
+
+
 def _fallback_match_by_slug(session, article_slug: str) -> Optional[Dict]:
     """
     Attempt to match article slug by normalising Unicode characters.
     Helps when stored titles contain diacritics that were stripped on the frontend.
+    Runs even when the title_slug column exists, since unaccent() keeps characters
+    (e.g. '–', 'ß') that _normalise_slug drops.
     """
     fallback_query = """
         SELECT id, title, intro, summary, url, category, tags, top_image, scraped_at,
@@ -142,13 +179,28 @@ def _fallback_match_by_slug(session, article_slug: str) -> Optional[Dict]:
     return None
 
 
+_SLUG_STRIP_PUNCT = str.maketrans("", "", ".,")
+_SLUG_DISALLOWED = re.compile(r"[^a-z0-9-]")
+
+# Slovak (and Czech) letters with diacritics, folded to what NFKD + ASCII-drop would give.
+_SLOVAK_DIACRITICS = "áäčďéěíĺľňóôŕřšťúůýžÁÄČĎÉĚÍĹĽŇÓÔŔŘŠŤÚŮÝŽ"
+_ASCII_FOLD = str.maketrans(
+    {
+        char: unicodedata.normalize("NFKD", char).encode("ascii", "ignore").decode("ascii")
+        for char in _SLOVAK_DIACRITICS
+    }
+)
+
+
 def _title_to_slug(title: str) -> str:
-    slug = re.sub(r"[.,]", "", title)
-    slug = slug.strip().replace(" ", "-")
-    return slug.lower()
+    # Punctuation is dropped before strip() so titles like ". Názov" trim the same as before.
+    return title.translate(_SLUG_STRIP_PUNCT).strip().replace(" ", "-").lower()
 
 
 def _normalise_slug(value: str) -> str:
-    normalised = unicodedata.normalize("NFKD", value)
-    ascii_only = normalised.encode("ascii", "ignore").decode("ascii")
-    return re.sub(r"[^a-z0-9-]", "", ascii_only.lower())
+    ascii_only = value.translate(_ASCII_FOLD)
+    if not ascii_only.isascii():
+        # Characters outside the Slovak table take the generic Unicode route.
+        normalised = unicodedata.normalize("NFKD", ascii_only)
+        ascii_only = normalised.encode("ascii", "ignore").decode("ascii")
+    return _SLUG_DISALLOWED.sub("", ascii_only.lower())
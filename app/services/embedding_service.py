@@ -1,44 +1,102 @@
-import logging
-import os
+import math
+from functools import lru_cache
 from typing import List, Optional
 
 import numpy as np
 from dotenv import load_dotenv
-from openai import OpenAI
 
-load_dotenv()
+from app.utils.simd_cosine import cosine_rows
+from app.utils.vectorstore import get_embeddings
 
-_api_key = os.getenv("OPENAI_API_KEY")
-_openai_client: Optional[OpenAI] = None
+try:
+    import simsimd
+except ImportError:
+    # SimSIMD is optional; Numba or NumPy computes the similarities without it.
+    simsimd = None
 
-if _api_key:
-    _openai_client = OpenAI(api_key=_api_key)
-else:
-    logging.warning("OPENAI_API_KEY not configured; embedding generation will be disabled.")
+load_dotenv()
 
 
 def get_embedding(text: str) -> Optional[List[float]]:
     """Generate embeddings for the supplied text using OpenAI."""
-    if not _openai_client:
-        logging.error("Embedding requested but OpenAI client is not initialized.")
-        return None
+    # vectorstore owns the one batching path, with chunking and the per-request token cap.
+    return get_embeddings([text])[0]
+
+
+class _EmbeddingUnavailable(Exception):
+    """Raised inside the query-embedding cache so failed lookups are not memoised."""
+
 
+@lru_cache(maxsize=1024)
+def _cached_query_embedding(query: str) -> np.ndarray:
+    embedding = get_embedding(query)
+    if not embedding:
+        raise _EmbeddingUnavailable
+    # float32 keeps a cached 1536-dim entry at ~6 KB; read-only so callers cannot alter the cache.
+    vector = np.asarray(embedding, dtype=np.float32)
+    vector.setflags(write=False)
+    return vector
+
+
+def get_query_embedding(query: str) -> Optional[np.ndarray]:
+    """Embedding for a search query, cached per process so repeated searches skip the API call."""
     try:
-        response = _openai_client.embeddings.create(
-            model="text-embedding-ada-002",
-            input=text,
-        )
-        return response.data[0].embedding
-    except Exception as exc:
-        logging.error("Error generating embedding: %s", exc)
+        return _cached_query_embedding(" ".join(query.split()))
+    except _EmbeddingUnavailable:
         return None
 
 
 def cosine_similarity(vector_a: List[float], vector_b: List[float]) -> float:
     """Calculate cosine similarity between two vectors."""
-    a = np.array(vector_a)
-    b = np.array(vector_b)
-    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+    # float32 matches how embeddings are stored; asarray skips the copy for ndarray inputs.
+    a = np.asarray(vector_a, dtype=np.float32)
+    b = np.asarray(vector_b, dtype=np.float32)
+    if simsimd is not None:
+        return 1.0 - float(simsimd.cosine(a, b))
+    return float(np.dot(a, b) / math.sqrt(np.vdot(a, a) * np.vdot(b, b)))
+
+
+def quantize_int8(vector) -> np.ndarray:
+    """Scale `vector` so its largest magnitude maps to 127 and round to int8 (as embedding_to_int8 does in SQL)."""
+    v = np.asarray(vector, dtype=np.float32)
+    max_abs = float(np.abs(v).max()) if v.size else 0.0
+    if max_abs == 0.0:
+        return np.zeros(v.shape, dtype=np.int8)
+    return np.clip(np.rint(v * (127.0 / max_abs)), -127, 127).astype(np.int8)
+
+
+def cosine_similarity_batch(query: List[float], matrix, unit_rows: bool = False) -> np.ndarray:
+    """
+    Cosine similarity of `query` against every row of `matrix` (n x d), in one call.
+    With `unit_rows` the rows are known to be L2-normalised, so only the query is normalised
+    and the scores are a single matrix-vector product. An int8 `matrix` holds quantised rows.
+    """
+    q = np.asarray(query, dtype=np.float32)
+    m = np.asarray(matrix)
+    if m.dtype == np.int8:
+        # Quantised rows (article_embeddings.embedding_i8): SimSIMD scores int8 x int8 directly.
+        if simsimd is not None:
+            distances = np.asarray(simsimd.cdist(quantize_int8(q)[np.newaxis, :], m, metric="cosine"), dtype=np.float32)
+            return 1.0 - distances[0]
+        unit_rows = False
+    m = m.astype(np.float32, copy=False)
+    if unit_rows:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return m @ (q / math.sqrt(np.vdot(q, q)))
+    if simsimd is not None:
+        distances = np.asarray(simsimd.cdist(q[np.newaxis, :], m, metric="cosine"), dtype=np.float32)
+        return 1.0 - distances[0]
+    if cosine_rows is not None:
+        return cosine_rows(m, q)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Zero-length vectors come out as NaN, like the per-pair formula.
+        return (m @ q) / (np.sqrt(np.einsum("ij,ij->i", m, m)) * math.sqrt(np.vdot(q, q)))
 
 
-__all__ = ["get_embedding", "cosine_similarity"]
+__all__ = [
+    "get_embedding",
+    "get_query_embedding",
+    "cosine_similarity",
+    "cosine_similarity_batch",
+    "quantize_int8",
+]
@@ -24,15 +24,23 @@ def fact_check_article(article_id: str, max_facts: int = 5) -> Dict[str, Any]:
             raise FactCheckServiceError("Article not found")
 
         summary = row[0] or ""
+        # End the read transaction so the pooled connection is not held idle during the LLM calls.
+        session.commit()
         result = fact_check_summary(summary, max_facts=max_facts)
 
-        session.execute(
+        # The results can be regenerated, so this commit does not wait for the WAL flush. Both
+        # statements go to the server in one round trip; RETURNING reports whether the article
+        # still exists after the LLM calls.
+        updated = session.execute(
             text(
+                "SET LOCAL synchronous_commit = off; "
                 "UPDATE articles SET fact_check_results = CAST(:results AS JSONB) "
-                "WHERE id = :article_id"
+                "WHERE id = :article_id RETURNING id"
             ),
             {"results": json.dumps(result), "article_id": article_id},
-        )
+        ).fetchone()
+        if not updated:
+            raise FactCheckServiceError("Article not found")
         session.commit()
         logging.info(
             "Fact-check saved for article %s: status=%s facts=%s",
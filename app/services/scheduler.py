@@ -2,6 +2,7 @@ import atexit
 import logging
 import os
 import threading
+import time
 from typing import Optional
 
 from flask import Flask
@@ -66,10 +67,27 @@ class ScraperScheduler:
 
     # Internal helpers -----------------------------------------------------
     def _run_loop(self) -> None:
-        with self.app.app_context():
-            self._run_scraping(initial=True)
-            while not self._stop_event.wait(self.interval_seconds):
-                self._run_scraping(initial=False)
+        # Runs are scheduled at a fixed rate; slots missed while a run overran are coalesced
+        # into the next one instead of firing back to back.
+        next_run = time.monotonic()
+        initial = True
+        while True:
+            # The app context only lives for the run, not across the idle interval.
+            with self.app.app_context():
+                self._run_scraping(initial=initial)
+            initial = False
+
+            next_run += self.interval_seconds
+            now = time.monotonic()
+            if next_run <= now:
+                missed = int((now - next_run) // self.interval_seconds) + 1
+                logging.warning(
+                    "Scheduled scraping run overran the interval; skipping %s missed run(s).",
+                    missed,
+                )
+                next_run += missed * self.interval_seconds
+            if self._stop_event.wait(next_run - now):
+                return
 
     def _run_scraping(self, *, initial: bool) -> None:
         try:
@@ -1,6 +1,7 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from sqlalchemy import text
 
@@ -26,65 +27,56 @@ def _collect_processed_urls(scrape_payload: Dict[str, Any]) -> list[str]:
     return urls
 
 
-def _resolve_article_ids_by_urls(urls: list[str], limit: int) -> list[str]:
+def _resolve_article_ids_by_urls(session, urls: list[str], limit: int) -> list[str]:
     if not urls:
         return []
 
-    session = SessionLocal()
-    try:
-        article_ids: list[str] = []
-        seen_ids: set[str] = set()
-
-        for url in urls:
-            row = session.execute(
-                text(
-                    """
-                    SELECT id
-                    FROM articles
-                    WHERE :url = ANY(url)
-                    ORDER BY scraped_at DESC
-                    LIMIT 1
-                    """
-                ),
-                {"url": url},
-            ).fetchone()
-
-            if not row:
-                continue
+    # One round trip for all URLs: the newest article per URL, in the order the URLs were given.
+    # `@>` (rather than `= ANY`) lets each probe use the GIN index on articles.url; the URLs are
+    # cast to varchar[] because array operators need both sides to match the column type.
+    rows = session.execute(
+        text(
+            """
+            SELECT DISTINCT ON (u.position) u.position, a.id
+            FROM unnest(CAST(:urls AS varchar[])) WITH ORDINALITY AS u(url, position)
+            JOIN articles a ON a.url @> ARRAY[u.url]
+            ORDER BY u.position, a.scraped_at DESC
+            """
+        ),
+        {"urls": urls},
+    ).fetchall()
+
+    article_ids: list[str] = []
+    seen_ids: set[str] = set()
+
+    for _, raw_id in rows:
+        article_id = str(raw_id)
+        if article_id in seen_ids:
+            continue
 
-            article_id = str(row[0])
-            if article_id in seen_ids:
-                continue
+        seen_ids.add(article_id)
+        article_ids.append(article_id)
 
-            seen_ids.add(article_id)
-            article_ids.append(article_id)
+        if len(article_ids) >= limit:
+            break
 
-            if len(article_ids) >= limit:
-                break
+    return article_ids
 
-        return article_ids
-    finally:
-        session.close()
 
-
-def _resolve_article_ids_since(started_at: datetime, limit: int) -> list[str]:
-    session = SessionLocal()
-    try:
-        rows = session.execute(
-            text(
-                """
-                SELECT id
-                FROM articles
-                WHERE scraped_at >= :started_at
-                ORDER BY scraped_at DESC
-                LIMIT :limit
-                """
-            ),
-            {"started_at": started_at, "limit": limit},
-        ).fetchall()
-        return [str(row[0]) for row in rows]
-    finally:
-        session.close()
+def _resolve_article_ids_since(session, started_at: datetime, limit: int) -> list[str]:
+    rows = session.execute(
+        text(
+            """
+            SELECT id
+            FROM articles
+            WHERE scraped_at >= :started_at
+            ORDER BY scraped_at DESC
+            LIMIT :limit
+            """
+        ),
+        {"started_at": started_at, "limit": limit},
+    ).fetchall()
+    return [str(row[0]) for row in rows]
 
 
 def run_scraping(max_articles_per_page: int = 3, max_total_articles: Optional[int] = None) -> Dict[str, Any]:
@@ -175,6 +167,25 @@ def run_scraping_per_source(
     }
 
 
+def _fact_check_outcome(article_id: str, max_facts: int) -> Tuple[Dict[str, Any], bool]:
+    """Fact-check one article; returns (result or error entry, is_error)."""
+    try:
+        result = fact_check_article(article_id, max_facts=max_facts)
+        return (
+            {
+                "article_id": article_id,
+                "status": result.get("status"),
+                "facts_count": len(result.get("facts", [])),
+            },
+            False,
+        )
+    except FactCheckServiceError as exc:
+        return {"article_id": article_id, "error": str(exc)}, True
+    except Exception as exc:  # pragma: no cover
+        logging.error("Unexpected fact-check failure for %s: %s", article_id, exc, exc_info=True)
+        return {"article_id": article_id, "error": "Unexpected fact-check failure"}, True
+
+
 def run_scraping_with_fact_check(
     max_total_articles: int = 3,
     max_articles_per_page: int = 3,
@@ -184,14 +195,9 @@ def run_scraping_with_fact_check(
     if max_total_articles <= 0:
         max_total_articles = 1
 
-    session = SessionLocal()
-    try:
-        started_at = session.execute(text("SELECT CURRENT_TIMESTAMP")).scalar()
-    finally:
-        session.close()
-
-    if not started_at:
-        started_at = datetime.utcnow()
+    # articles.scraped_at is a naive TIMESTAMP written from the app host's local clock,
+    # so the window start has to be naive local time as well.
+    started_at = datetime.now()
 
     scrape_payload = run_scraping(
         max_articles_per_page=max_articles_per_page,
@@ -199,16 +205,19 @@ def run_scraping_with_fact_check(
     )
 
     processed_urls = _collect_processed_urls(scrape_payload)
-    processed_article_ids = _resolve_article_ids_by_urls(
-        urls=processed_urls,
-        limit=max_total_articles,
-    )
-    if not processed_article_ids:
-        # Fallback for older payloads or unusual URL matching edge-cases.
-        processed_article_ids = _resolve_article_ids_since(
-            started_at=started_at,
+    with SessionLocal() as session:
+        processed_article_ids = _resolve_article_ids_by_urls(
+            session,
+            urls=processed_urls,
             limit=max_total_articles,
         )
+        if not processed_article_ids:
+            # Fallback for older payloads or unusual URL matching edge-cases.
+            processed_article_ids = _resolve_article_ids_since(
+                session,
+                started_at=started_at,
+                limit=max_total_articles,
+            )
 
     fact_check_results = []
     fact_check_errors = []
@@ -219,31 +228,20 @@ def run_scraping_with_fact_check(
         len(processed_urls),
     )
 
-    for article_id in processed_article_ids:
-        try:
-            result = fact_check_article(article_id, max_facts=max_facts_per_article)
-            fact_check_results.append(
-                {
-                    "article_id": article_id,
-                    "status": result.get("status"),
-                    "facts_count": len(result.get("facts", [])),
-                }
-            )
-        except FactCheckServiceError as exc:
-            fact_check_errors.append(
-                {
-                    "article_id": article_id,
-                    "error": str(exc),
-                }
-            )
-        except Exception as exc:  # pragma: no cover
-            logging.error("Unexpected fact-check failure for %s: %s", article_id, exc, exc_info=True)
-            fact_check_errors.append(
-                {
-                    "article_id": article_id,
-                    "error": "Unexpected fact-check failure",
-                }
+    if processed_article_ids:
+        # Each fact-check opens its own session and is dominated by API latency, so they run in parallel.
+        max_workers = min(len(processed_article_ids), 8)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="FactCheck") as executor:
+            outcomes = executor.map(
+                lambda article_id: _fact_check_outcome(article_id, max_facts_per_article),
+                processed_article_ids,
             )
+            # map() yields in submission order, so results keep the selected-article order.
+            for outcome, is_error in outcomes:
+                if is_error:
+                    fact_check_errors.append(outcome)
+                else:
+                    fact_check_results.append(outcome)
 
     return {
         "message": "Scraping with fact-check completed",
@@ -1,15 +1,16 @@
 import logging
 import json
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 from sqlalchemy import text
+from sqlalchemy.exc import DataError, ProgrammingError
 
 from data.db import SessionLocal
-from app.utils.vectorstore import store_embedding
+from app.utils.vectorstore import decode_embedding, store_embedding
 from app.utils.similarity import semantic_query_search
 
-from .embedding_service import cosine_similarity, get_embedding
+from .embedding_service import cosine_similarity_batch, get_embedding, get_query_embedding
 
 
 class SearchServiceError(Exception):
@@ -42,8 +43,8 @@ def search_articles(query: str, advanced: bool) -> List[Dict]:
     try:
         if advanced:
             logging.info("Performing advanced vector search for: %s", query)
-            query_embedding = get_embedding(query)
-            if not query_embedding:
+            query_embedding = get_query_embedding(query)
+            if query_embedding is None:
                 raise EmbeddingGenerationError("Failed to generate query embedding")
 
             embeddings_count = session.execute(
@@ -68,23 +69,26 @@ def search_articles(query: str, advanced: bool) -> List[Dict]:
                 logging.warning("No embeddings found, falling back to regular search")
 
         logging.info("Performing regular text search for: %s", query)
-        search_query = f"%{query.lower()}%"
-        sql_query = """
-            SELECT DISTINCT
-                id, title, intro, summary, url, category, tags, top_image, scraped_at,
-                fact_check_results, summary_annotations
-            FROM articles 
-            WHERE 
-                LOWER(title) LIKE :query OR
-                LOWER(summary) LIKE :query OR
-                LOWER(intro) LIKE :query OR
-                LOWER(category) LIKE :query OR
-                tags::text LIKE :query
-            ORDER BY scraped_at DESC
-            LIMIT 20
-        """
+        result = _full_text_search(session, query)
+        if not result:
+            # Whole-word search found nothing (or is unavailable); keep the substring semantics.
+            search_query = f"%{query.lower()}%"
+            sql_query = """
+                SELECT DISTINCT
+                    id, title, intro, summary, url, category, tags, top_image, scraped_at,
+                    fact_check_results, summary_annotations
+                FROM articles 
+                WHERE 
+                    LOWER(title) LIKE :query OR
+                    LOWER(summary) LIKE :query OR
+                    LOWER(intro) LIKE :query OR
+                    LOWER(category) LIKE :query OR
+                    tags::text LIKE :query
+                ORDER BY scraped_at DESC
+                LIMIT 20
+            """
+            result = session.execute(text(sql_query), {"query": search_query}).fetchall()
 
-        result = session.execute(text(sql_query), {"query": search_query})
         articles = []
         seen_titles = set()
         for r in result:
@@ -105,6 +109,52 @@ def search_articles(query: str, advanced: bool) -> List[Dict]:
         session.close()
 
 
+# Cleared once the search_vec column (data/migrations/add_search_vector.sql) turns out to be missing.
+_search_vector_available = True
+
+# Cleared once article_embeddings.embedding_vec (data/migrations/add_embedding_vector.sql) turns out to be missing.
+_embedding_vector_available = True
+
+# Nearest neighbours fetched from the index; enough to leave 10 after deduplicating titles.
+_SIMILAR_CANDIDATES = 20
+_MIN_SIMILARITY = 0.05
+
+# Cleared once article_embeddings.embedding_i8 (data/migrations/add_embedding_i8.sql) turns out to be missing.
+_embedding_i8_available = True
+
+# Articles shortlisted on the int8 embeddings before the exact float32 rescoring.
+_RERANK_CANDIDATES = 64
+
+# Without the embedding_vec column similar articles are ranked in Python among this many newest
+# articles, with or without the int8 shortlist.
+_MAX_SCANNED_ARTICLES = 500
+
+
+def _full_text_search(session, query: str) -> List:
+    """Rows matching `query` through the GIN-indexed articles.search_vec, best ranked first."""
+    global _search_vector_available
+
+    if not _search_vector_available:
+        return []
+
+    full_text_query = """
+        SELECT
+            id, title, intro, summary, url, category, tags, top_image, scraped_at,
+            fact_check_results, summary_annotations
+        FROM articles, websearch_to_tsquery('simple', :query) AS tsq
+        WHERE search_vec @@ tsq
+        ORDER BY ts_rank(search_vec, tsq) DESC, scraped_at DESC
+        LIMIT 20
+    """
+    try:
+        return session.execute(text(full_text_query), {"query": query}).fetchall()
+    except ProgrammingError:
+        session.rollback()
+        _search_vector_available = False
+        logging.warning("articles.search_vec is missing; falling back to LIKE text search.")
+        return []
+
+
 def find_similar_articles(article_id: str) -> List[Dict]:
     """Find semantically similar articles based on embeddings."""
     session = SessionLocal()
@@ -140,7 +190,7 @@ def find_similar_articles(article_id: str) -> List[Dict]:
             fresh_embedding = get_embedding(current_summary)
             if fresh_embedding:
                 try:
-                    store_embedding(article_id, current_summary)
+                    store_embedding(article_id, current_summary, embedding=fresh_embedding)
                     current_embedding = fresh_embedding
                     logging.info(
                         "Generated and stored new embedding for article %s",
@@ -157,28 +207,31 @@ def find_similar_articles(article_id: str) -> List[Dict]:
             )
             return _recent_articles(session, article_id, limit=10)
 
-        logging.info("Performing fresh semantic similarity search across all articles")
-        similarity_query = """
-            SELECT 
-                a.id, a.title, a.intro, a.summary, a.url, a.category, a.tags, a.top_image, a.scraped_at,
-                a.fact_check_results, a.summary_annotations,
-                ae.embedding
-            FROM articles a
-            INNER JOIN article_embeddings ae ON a.id = ae.id
-            WHERE a.id != :article_id AND ae.embedding IS NOT NULL
-            ORDER BY a.scraped_at DESC
-        """
+        articles_with_similarity = _rank_similar_in_database(session, article_id, current_embedding)
+
+        if articles_with_similarity is None:
+            logging.info("Performing fresh semantic similarity search across all articles")
+            params = {"article_id": article_id, "scan_limit": _MAX_SCANNED_ARTICLES}
+            candidate_filter = ""
+            candidate_ids = _quantized_candidates(session, article_id, current_embedding)
+            if candidate_ids is not None:
+                # Only the int8 shortlist is fetched in full precision and rescored exactly.
+                candidate_filter = "AND ae.id = ANY(CAST(:candidate_ids AS uuid[]))"
+                params["candidate_ids"] = candidate_ids
+            similarity_query = f"""
+                SELECT 
+                    a.id, a.title, a.intro, a.summary, a.url, a.category, a.tags, a.top_image, a.scraped_at,
+                    a.fact_check_results, a.summary_annotations,
+                    array_send(ae.embedding)
+                FROM articles a
+                INNER JOIN article_embeddings ae ON a.id = ae.id
+                WHERE a.id != :article_id AND ae.embedding IS NOT NULL {candidate_filter}
+                ORDER BY a.scraped_at DESC
+                LIMIT :scan_limit
+            """
 
-        articles_with_similarity = _collect_similar_articles(
-            session, similarity_query, article_id, current_embedding, 0.1
-        )
-
-        if not articles_with_similarity:
-            logging.warning(
-                "No articles found with similarity > 0.1, trying with very low threshold"
-            )
             articles_with_similarity = _collect_similar_articles(
-                session, similarity_query, article_id, current_embedding, 0.05
+                session, similarity_query, params, current_embedding, (0.1, _MIN_SIMILARITY)
             )
 
         if not articles_with_similarity:
@@ -219,43 +272,171 @@ def find_similar_articles(article_id: str) -> List[Dict]:
         raise SearchServiceError("Failed to find similar articles") from exc
     finally:
         session.close()
+
+
+def _vector_literal(embedding: List[float]) -> str:
+    return "[" + ",".join(map(str, embedding)) + "]"
+
+
+def _rank_similar_in_database(session, article_id: str, base_embedding: List[float]) -> Optional[List[Dict]]:
+    """
+    Nearest articles by cosine distance, ranked by PostgreSQL over the HNSW index on
+    article_embeddings.embedding_vec. Returns None when the Python scan has to be used instead.
+    """
+    global _embedding_vector_available
+
+    if not _embedding_vector_available:
+        return None
+
+    nearest_query = """
+        SELECT
+            a.id, a.title, a.intro, a.summary, a.url, a.category, a.tags, a.top_image, a.scraped_at,
+            a.fact_check_results, a.summary_annotations,
+            1 - (ae.embedding_vec <=> CAST(:embedding AS vector)) AS similarity
+        FROM article_embeddings ae
+        INNER JOIN articles a ON a.id = ae.id
+        WHERE a.id != :article_id AND ae.embedding_vec IS NOT NULL
+        ORDER BY ae.embedding_vec <=> CAST(:embedding AS vector)
+        LIMIT :limit
+    """
+    params = {
+        "article_id": article_id,
+        "embedding": _vector_literal(base_embedding),
+        "limit": _SIMILAR_CANDIDATES,
+    }
+    try:
+        rows = session.execute(text(nearest_query), params).fetchall()
+    except ProgrammingError:
+        session.rollback()
+        _embedding_vector_available = False
+        logging.warning("article_embeddings.embedding_vec is missing; falling back to scanning embeddings in Python.")
+        return None
+    except DataError:
+        # The query embedding does not have the indexed dimension.
+        session.rollback()
+        return None
+
+    if not rows:
+        # Stored embeddings of another dimension are only reachable through the Python scan.
+        return None
+
+    logging.info("Vector index returned %s nearest articles", len(rows))
+    return [
+        {"similarity": float(row[11]), **_row_to_article_dict(row)}
+        for row in rows
+        if row[11] is not None and row[11] > _MIN_SIMILARITY
+    ]
+
+
+def _quantized_candidates(session, article_id: str, base_embedding: List[float]) -> Optional[List[str]]:
+    """
+    IDs of the articles closest to `base_embedding` according to the int8 copies of the stored
+    embeddings (article_embeddings.embedding_i8), taken from the same _MAX_SCANNED_ARTICLES newest
+    articles as the full-precision scan, or None when all of those should be scored exactly.
+    """
+    global _embedding_i8_available
+
+    if not _embedding_i8_available:
+        return None
+
+    quantized_query = """
+        SELECT ae.id, ae.embedding_i8
+        FROM article_embeddings ae
+        INNER JOIN articles a ON a.id = ae.id
+        WHERE a.id != :article_id AND ae.embedding_i8 IS NOT NULL
+        ORDER BY a.scraped_at DESC
+        LIMIT :scan_limit
+    """
+    try:
+        rows = session.execute(
+            text(quantized_query), {"article_id": article_id, "scan_limit": _MAX_SCANNED_ARTICLES}
+        ).fetchall()
+    except ProgrammingError:
+        session.rollback()
+        _embedding_i8_available = False
+        logging.warning("article_embeddings.embedding_i8 is missing; scanning full-precision embeddings.")
+        return None
+
+    dimension = len(base_embedding)
+    rows = [row for row in rows if len(row[1]) == dimension]
+    if len(rows) <= _RERANK_CANDIDATES:
+        # A shortlist would hold every article anyway.
+        return None
+
+    matrix = np.frombuffer(b"".join(bytes(row[1]) for row in rows), dtype=np.int8).reshape(len(rows), dimension)
+    similarities = np.nan_to_num(cosine_similarity_batch(base_embedding, matrix), nan=-1.0)
+    top = np.argpartition(similarities, -_RERANK_CANDIDATES)[-_RERANK_CANDIDATES:]
+    return [str(rows[index][0]) for index in top]
+
+
 def _collect_similar_articles(
-    session, query: str, article_id: str, base_embedding: List[float], threshold: float
+    session, query: str, params: Dict, base_embedding: List[float], thresholds: Sequence[float]
 ) -> List[Dict]:
-    result = session.execute(text(query), {"article_id": article_id})
-    articles_with_similarity: List[Dict] = []
-    similarity_scores = []
-    processed_count = 0
+    """
+    Score every stored embedding in one pass and return the top candidates above the first
+    threshold in `thresholds` that matches anything, most similar first.
+    """
+    result = session.execute(text(query), params)
+    dimension = len(base_embedding)
+    rows = []
+    embeddings = []
 
     for row in result:
-        stored_embedding = row[11]
-        if stored_embedding and len(stored_embedding) > 0:
-            try:
-                similarity = cosine_similarity(base_embedding, stored_embedding)
-                processed_count += 1
-                similarity_scores.append(similarity)
-                if similarity > threshold:
-                    articles_with_similarity.append(
-                        {
-                            "similarity": float(similarity),
-                            **_row_to_article_dict(row),
-                        }
-                    )
-            except Exception as exc:
-                logging.warning("Error calculating similarity for article %s: %s", row[0], exc)
+        stored_embedding = decode_embedding(row[11])
+        if stored_embedding is None:
+            continue
+        if stored_embedding.size != dimension:
+            logging.warning(
+                "Error calculating similarity for article %s: embedding has %s dimensions, expected %s",
+                row[0],
+                stored_embedding.size,
+                dimension,
+            )
+            continue
+        rows.append(row)
+        embeddings.append(stored_embedding)
+
+    if not rows:
+        return []
 
-    if similarity_scores:
-        avg_similarity = sum(similarity_scores) / len(similarity_scores)
-        max_similarity = max(similarity_scores)
+    # (n, d) float32 matrix scored with a single GEMV; the row metadata stays in `rows`.
+    matrix = np.stack(embeddings)
+    # Stored embeddings are L2-normalised (see data/migrations/normalize_embeddings.sql).
+    similarities = cosine_similarity_batch(base_embedding, matrix, unit_rows=True)
+    valid = ~np.isnan(similarities)
+    for index in np.flatnonzero(~valid):
+        logging.warning("Error calculating similarity for article %s: zero-length embedding", rows[index][0])
+
+    candidates = np.empty(0, dtype=np.intp)
+    for position, threshold in enumerate(thresholds):
+        candidates = np.flatnonzero(valid & (similarities > threshold))
+        if candidates.size:
+            break
+        if position + 1 < len(thresholds):
+            logging.warning(
+                "No articles found with similarity > %s, trying with very low threshold", threshold
+            )
+
+    scored = similarities[valid]
+    if scored.size:
         logging.info(
             "Similarity stats: processed=%s, found=%s, avg=%.3f, max=%.3f",
-            processed_count,
-            len(articles_with_similarity),
-            avg_similarity,
-            max_similarity,
+            scored.size,
+            candidates.size,
+            float(scored.mean()),
+            float(scored.max()),
         )
 
-    return articles_with_similarity
+    if candidates.size > _SIMILAR_CANDIDATES:
+        # Only the best candidates are needed, so skip a full sort of every score.
+        top = np.argpartition(similarities[candidates], -_SIMILAR_CANDIDATES)[-_SIMILAR_CANDIDATES:]
+        candidates = candidates[top]
+    candidates = candidates[np.argsort(-similarities[candidates], kind="stable")]
+
+    return [
+        {"similarity": float(similarities[index]), **_row_to_article_dict(rows[index])}
+        for index in candidates
+    ]
 
 
 def _recent_articles(session, article_id: str, limit: int) -> List[Dict]:
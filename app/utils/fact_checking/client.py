@@ -2,8 +2,17 @@ import os
 from dotenv import load_dotenv
 from openai import OpenAI
 
+from app.utils.openai_client import get_client as get_openai_client
+
 load_dotenv()
 
 API_KEY = os.getenv("OPENAI_API_KEY")
 FACT_CHECK_MODEL = os.getenv("OPENAI_FACT_CHECK_MODEL", os.getenv("OPENAI_MODEL", "gpt-4o-mini"))
-CLIENT = OpenAI(api_key=API_KEY)
+
+
+def get_client() -> OpenAI:
+    """The shared OpenAI client; raises when OPENAI_API_KEY is not configured."""
+    client = get_openai_client()
+    if client is None:
+        raise RuntimeError("OPENAI_API_KEY is not configured; fact-checking is unavailable.")
+    return client
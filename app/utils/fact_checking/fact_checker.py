@@ -1,13 +1,20 @@
 from datetime import datetime, timezone
 import logging
-import json
 import re
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, Dict, List, Tuple
 
-from .client import CLIENT, FACT_CHECK_MODEL
+import orjson
+
+from .client import FACT_CHECK_MODEL, get_client
 from .parser import safe_json
 from .prompts import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
 
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# Only web links are kept as fact sources.
+_HTTP_SCHEMES = ("http://", "https://")
+_FACT_STATUSES = frozenset({"found", "not_found"})
+
 
 def _strip_closing_sentence(summary: str) -> str:
     if not summary:
@@ -17,6 +24,11 @@ def _strip_closing_sentence(summary: str) -> str:
     return summary.strip()
 
 
+def _stripped(value: Any) -> str:
+    # Model output fields are nearly always strings already, so str() is only called for the rest.
+    return value.strip() if isinstance(value, str) else str(value).strip()
+
+
 def _normalize_fact_items(raw_items: Any) -> List[Dict[str, Any]]:
     if not isinstance(raw_items, list):
         return []
@@ -24,19 +36,19 @@ def _normalize_fact_items(raw_items: Any) -> List[Dict[str, Any]]:
     for item in raw_items:
         if not isinstance(item, dict):
             continue
-        fact = str(item.get("fact", "")).strip()
+        fact = _stripped(item.get("fact", ""))
         source_url = item.get("source_url")
         source_title = item.get("source_title")
-        status = str(item.get("status", "")).strip().lower()
+        status = _stripped(item.get("status", "")).lower()
 
-        source_url_clean = str(source_url).strip() if source_url else ""
-        if source_url_clean and not source_url_clean.startswith(("http://", "https://")):
+        source_url_clean = _stripped(source_url) if source_url else ""
+        if source_url_clean and not source_url_clean.startswith(_HTTP_SCHEMES):
             source_url_clean = ""
 
         if not source_url_clean:
             status = "not_found"
             source_title = None
-        elif status not in {"found", "not_found"}:
+        elif status not in _FACT_STATUSES:
             status = "found"
 
         normalized.append(
@@ -50,92 +62,78 @@ def _normalize_fact_items(raw_items: Any) -> List[Dict[str, Any]]:
     return normalized
 
 
-def _extract_response_text(response: Any) -> str:
+def _parse_response(response: Any) -> Tuple[str, List[Dict[str, str]]]:
+    """Output text and distinct web search sources of a Responses API result, in one pass over its output."""
+    # output_text is a property of the SDK object, not a field, so it is read before dumping.
     output_text = getattr(response, "output_text", "") or ""
-    if isinstance(output_text, str) and output_text.strip():
-        return output_text
-
-    chunks: list[str] = []
-    for item in getattr(response, "output", []) or []:
-        content = getattr(item, "content", None)
-        if content is None and isinstance(item, dict):
-            content = item.get("content")
-        if not isinstance(content, list):
-            continue
+    has_output_text = isinstance(output_text, str) and bool(output_text.strip())
 
-        for part in content:
-            part_text = getattr(part, "text", None)
-            if part_text is None and isinstance(part, dict):
-                part_text = part.get("text")
-            if isinstance(part_text, str) and part_text.strip():
-                chunks.append(part_text.strip())
-
-    return "\n".join(chunks).strip()
+    # One conversion to plain dicts up front; the walk below is then only dict lookups.
+    data = response.model_dump(exclude_none=True) if hasattr(response, "model_dump") else response
+    if not isinstance(data, dict):
+        data = {}
 
+    chunks: list[str] = []
+    sources: List[Dict[str, str]] = []
+    seen_urls: set[str] = set()
 
-def _fallback_facts_from_summary(summary: str, max_facts: int) -> List[Dict[str, Any]]:
-    # Keep a deterministic fallback so frontend always has explicit "not found" facts
-    # when external search output is malformed.
-    candidates = re.split(r"(?<=[.!?])\s+", summary.strip())
-    facts: List[Dict[str, Any]] = []
-    for sentence in candidates:
-        cleaned = sentence.strip()
-        if len(cleaned) < 25:
+    for item in data.get("output") or []:
+        if not isinstance(item, dict):
             continue
-        facts.append(
-            {
-                "fact": cleaned,
-                "source_url": None,
-                "source_title": None,
-                "status": "not_found",
-            }
-        )
-        if len(facts) >= max_facts:
-            break
-    return facts
+        if item.get("type") == "web_search_call":
+            action = item.get("action")
+            raw_sources = action.get("sources") if isinstance(action, dict) else None
+            if not isinstance(raw_sources, list):
+                continue
 
+            for source in raw_sources:
+                if not isinstance(source, dict):
+                    continue
+                url = str(source.get("url") or "").strip()
+                title = str(source.get("title") or "").strip()
 
-def _extract_search_sources(response: Any) -> List[Dict[str, str]]:
-    sources: List[Dict[str, str]] = []
-    seen_urls: set[str] = set()
+                if not url.startswith(_HTTP_SCHEMES):
+                    continue
+                if url in seen_urls:
+                    continue
 
-    for item in getattr(response, "output", []) or []:
-        item_type = getattr(item, "type", None)
-        if item_type is None and isinstance(item, dict):
-            item_type = item.get("type")
-        if item_type != "web_search_call":
+                seen_urls.add(url)
+                sources.append({"url": url, "title": title})
             continue
 
-        action = getattr(item, "action", None)
-        if action is None and isinstance(item, dict):
-            action = item.get("action")
+        if has_output_text:
+            continue
+        content = item.get("content")
+        if not isinstance(content, list):
+            continue
 
-        raw_sources = None
-        if action is not None:
-            raw_sources = getattr(action, "sources", None)
-            if raw_sources is None and isinstance(action, dict):
-                raw_sources = action.get("sources")
+        for part in content:
+            part_text = part.get("text") if isinstance(part, dict) else None
+            if isinstance(part_text, str) and part_text.strip():
+                chunks.append(part_text.strip())
 
-        if not isinstance(raw_sources, list):
-            continue
+    text = output_text if has_output_text else "\n".join(chunks).strip()
+    return text, sources
 
-        for source in raw_sources:
-            if isinstance(source, dict):
-                url = str(source.get("url", "")).strip()
-                title = str(source.get("title", "")).strip()
-            else:
-                url = str(getattr(source, "url", "") or "").strip()
-                title = str(getattr(source, "title", "") or "").strip()
 
-            if not url.startswith(("http://", "https://")):
-                continue
-            if url in seen_urls:
-                continue
+def _extract_response_text(response: Any) -> str:
+    return _parse_response(response)[0]
 
-            seen_urls.add(url)
-            sources.append({"url": url, "title": title})
 
-    return sources
+def _fallback_facts_from_summary(summary: str, max_facts: int) -> List[Dict[str, Any]]:
+    # Keep a deterministic fallback so frontend always has explicit "not found" facts
+    # when external search output is malformed.
+    sentences = (sentence.strip() for sentence in _SENTENCE_SPLIT_RE.split(summary.strip()))
+    long_sentences = (sentence for sentence in sentences if len(sentence) >= 25)
+    return [
+        {
+            "fact": sentence,
+            "source_url": None,
+            "source_title": None,
+            "status": "not_found",
+        }
+        for sentence in islice(long_sentences, max(max_facts, 1))
+    ]
 
 
 def _assign_distinct_sources(
@@ -145,42 +143,33 @@ def _assign_distinct_sources(
     if not facts:
         return facts
 
-    source_pool = [
-        source for source in sources
-        if source.get("url", "").startswith(("http://", "https://"))
-    ]
+    # Distinct source URLs in order of appearance, mapped to their first title.
+    source_pool: Dict[str, Any] = {}
+    for source in sources:
+        url = str(source.get("url") or "").strip()
+        if url.startswith(_HTTP_SCHEMES):
+            source_pool.setdefault(url, source.get("title"))
     if not source_pool:
         return facts
 
-    used_urls: set[str] = set()
-    source_index = 0
+    # A URL a fact already cites is never handed to another fact.
+    existing_urls = {str(fact.get("source_url") or "").strip() for fact in facts}
+    unused_urls = (url for url in source_pool if url not in existing_urls)
+    kept_urls: set[str] = set()
 
-    # Keep already assigned unique URLs first.
     for fact in facts:
+        # Keep the first fact citing each URL; the others get the next unused source.
         existing_url = str(fact.get("source_url") or "").strip()
-        if existing_url and existing_url not in used_urls:
-            used_urls.add(existing_url)
+        if existing_url and existing_url not in kept_urls:
+            kept_urls.add(existing_url)
             fact["status"] = "found"
             continue
-        fact["source_url"] = None
-        fact["source_title"] = None
-        fact["status"] = "not_found"
 
-    for fact in facts:
-        if fact.get("source_url"):
-            continue
-
-        while source_index < len(source_pool):
-            candidate = source_pool[source_index]
-            source_index += 1
-            candidate_url = str(candidate.get("url") or "").strip()
-            if not candidate_url or candidate_url in used_urls:
-                continue
-            used_urls.add(candidate_url)
-            fact["source_url"] = candidate_url
-            fact["source_title"] = candidate.get("title") or None
-            fact["status"] = "found"
-            break
+        url = next(unused_urls, None)
+        if url is None:
+            fact.update(source_url=None, source_title=None, status="not_found")
+        else:
+            fact.update(source_url=url, source_title=source_pool[url] or None, status="found")
 
     return facts
 
@@ -202,11 +191,11 @@ def _ensure_facts_in_slovak(facts: List[Dict[str, Any]]) -> List[Dict[str, Any]]
         "- Vráť iba JSON bez markdownu.\n"
         "Formát:\n"
         '{"facts": ["..."]}\n'
-        f"Vstupné tvrdenia:\n{json.dumps(fact_texts, ensure_ascii=False)}"
+        f"Vstupné tvrdenia:\n{orjson.dumps(fact_texts).decode()}"
     )
 
     try:
-        response = CLIENT.responses.create(
+        response = get_client().responses.create(
             model=FACT_CHECK_MODEL,
             instructions=(
                 "Si jazykový editor. Výstup musí byť výhradne v slovenčine "
@@ -245,7 +234,7 @@ def _create_fact_check_response(prompt: str) -> Any:
     }
 
     try:
-        return CLIENT.responses.create(
+        return get_client().responses.create(
             **params,
             tool_choice="required",
         )
@@ -254,22 +243,23 @@ def _create_fact_check_response(prompt: str) -> Any:
             "Fact-check with required tool_choice failed, retrying with auto: %s",
             exc,
         )
-        return CLIENT.responses.create(
+        return get_client().responses.create(
             **params,
             tool_choice="auto",
         )
 
 
 def _compute_overall_status(facts: List[Dict[str, Any]]) -> str:
-    if not facts:
-        return "Neoverene fakty"
-
-    found_count = sum(1 for fact in facts if fact.get("status") == "found")
-    if found_count == len(facts):
-        return "Overene fakty"
-    if found_count == 0:
-        return "Neoverene fakty"
-    return "Ciastocne overene fakty"
+    has_found = has_missing = False
+    for fact in facts:
+        if fact.get("status") == "found":
+            has_found = True
+        else:
+            has_missing = True
+        if has_found and has_missing:
+            # The answer cannot change once both kinds have been seen.
+            return "Ciastocne overene fakty"
+    return "Overene fakty" if has_found else "Neoverene fakty"
 
 
 def fact_check_summary(summary: str, max_facts: int = 5) -> Dict[str, Any]:
@@ -291,7 +281,7 @@ def fact_check_summary(summary: str, max_facts: int = 5) -> Dict[str, Any]:
 
     response = _create_fact_check_response(prompt)
 
-    output_text = _extract_response_text(response)
+    output_text, sources = _parse_response(response)
 
     payload = safe_json(output_text)
     facts = _normalize_fact_items(payload.get("facts"))
@@ -306,7 +296,6 @@ def fact_check_summary(summary: str, max_facts: int = 5) -> Dict[str, Any]:
         facts = _fallback_facts_from_summary(cleaned_summary, max_facts=max_facts)
 
     # Attach discovered search sources and prefer distinct URLs per fact.
-    sources = _extract_search_sources(response)
     facts = _assign_distinct_sources(facts, sources)
     facts = _ensure_facts_in_slovak(facts)
 
@@ -1,7 +1,10 @@
-import json
 import re
 from typing import Any, Dict
 
+import orjson
+
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
 
 def safe_json(content: Any) -> Dict[str, Any]:
     if isinstance(content, dict):
@@ -11,18 +14,18 @@ def safe_json(content: Any) -> Dict[str, Any]:
             combined = " ".join(
                 part.get("text", "") if isinstance(part, dict) else str(part) for part in content
             )
-            return json.loads(combined)
+            return orjson.loads(combined)
         except Exception:
             return {}
     try:
-        return json.loads(str(content))
+        return orjson.loads(str(content))
     except Exception:
         text = str(content).strip()
         text = text.replace("```json", "").replace("```", "").strip()
-        match = re.search(r"\{.*\}", text, flags=re.DOTALL)
+        match = _JSON_OBJECT_RE.search(text)
         if not match:
             return {}
         try:
-            return json.loads(match.group(0))
+            return orjson.loads(match.group(0))
         except Exception:
             return {}
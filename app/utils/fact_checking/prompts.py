@@ -4,10 +4,11 @@ SYSTEM_PROMPT = (
     "Text poľa `fact` musí byť vždy striktne v slovenčine."
 )
 
+# The article summary comes last, so every request for the same max_facts shares the same
+# instruction prefix and can be served from the API's automatic prompt cache.
 USER_PROMPT_TEMPLATE = (
-    "Zhrnutie článku:\n{summary}\n\n"
     "Úloha:\n"
-    "1. Vyber {max_facts} najdôležitejších, konkrétnych a overiteľných faktov zo zhrnutia.\n"
+    "1. Vyber {max_facts} najdôležitejších, konkrétnych a overiteľných faktov zo zhrnutia nižšie.\n"
     "2. Pre každý fakt vykonaj webové vyhľadávanie.\n"
     "3. Ak nájdeš relevantný zdroj, vráť URL a stručný názov zdroja.\n"
     "4. Ak zdroj nenájdeš, nastav source_url na null a status na \"not_found\".\n\n"
@@ -27,5 +28,6 @@ USER_PROMPT_TEMPLATE = (
     "    }}\n"
     "  ]\n"
     "}}\n"
-    "Nepíš žiadny ďalší text mimo JSON."
+    "Nepíš žiadny ďalší text mimo JSON.\n\n"
+    "Zhrnutie článku:\n{summary}"
 )
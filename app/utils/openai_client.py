@@ -0,0 +1,28 @@
+"""Process-wide OpenAI client shared by the embedding, fact-checking and analysis helpers."""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+from dotenv import load_dotenv
+from openai import DEFAULT_TIMEOUT, OpenAI
+
+load_dotenv()
+
+# Sized for the parallel fact-checks and batched embedding requests running side by side;
+# idle keep-alive connections spare later calls a new TLS handshake.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+@lru_cache(maxsize=None)
+def get_client() -> Optional[OpenAI]:
+    """Shared OpenAI client, created on first use; None when OPENAI_API_KEY is not configured."""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    http_client = httpx.Client(limits=_HTTP_LIMITS, timeout=DEFAULT_TIMEOUT, follow_redirects=True)
+    return OpenAI(api_key=api_key, http_client=http_client)
+
+
+__all__ = ["get_client"]
@@ -2,18 +2,32 @@ import logging
 import json
 from typing import Dict, Optional
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import orjson
+import tiktoken
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Concurrent API calls made by batch_analyze_political_orientation.
+BATCH_ANALYSIS_WORKERS = 10
+# Retries the OpenAI SDK makes on 429/5xx responses (exponential backoff, honouring Retry-After),
+# so a concurrent batch that hits the rate limit waits instead of failing articles.
+ANALYSIS_MAX_RETRIES = 4
+# Articles are cut to this many tokens before prompting; the classification settles well
+# before the end of a long article, and the rest only costs tokens and transfer time.
+MAX_ANALYSIS_TOKENS = 3000
+# Used instead when the tokenizer cannot be loaded (roughly four characters per token).
+MAX_ANALYSIS_CHARS = MAX_ANALYSIS_TOKENS * 4
+
 # Check if OpenAI is available
 openai_api_key = os.getenv("OPENAI_API_KEY")
 if openai_api_key:
     try:
-        from openai import OpenAI
-        from pydantic import BaseModel, Field
-        
-        client = OpenAI(api_key=openai_api_key)
+        from app.utils.openai_client import get_client
+
+        client = get_client().with_options(max_retries=ANALYSIS_MAX_RETRIES)
         model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         openai_available = True
         logging.info("OpenAI client initialized successfully for political analysis")
@@ -26,10 +40,27 @@ else:
     openai_available = False
     client = None
 
-class PoliticalOrientationResponse(BaseModel):
-    orientation: str = Field(description="Political orientation: 'left', 'right', or 'neutral'")
-    confidence: float = Field(description="Confidence level between 0.0 and 1.0")
-    reasoning: str = Field(description="Brief explanation of the analysis")
+# JSON schema of the model's answer; with strict mode the API guarantees these three fields,
+# so the reply is read with orjson instead of being validated into a Pydantic model.
+POLITICAL_ORIENTATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "orientation": {
+            "type": "string",
+            "description": "Political orientation: 'left', 'right', or 'neutral'",
+        },
+        "confidence": {
+            "type": "number",
+            "description": "Confidence level between 0.0 and 1.0",
+        },
+        "reasoning": {
+            "type": "string",
+            "description": "Brief explanation of the analysis",
+        },
+    },
+    "required": ["orientation", "confidence", "reasoning"],
+    "additionalProperties": False,
+}
 
 def analyze_political_orientation(article_text: str) -> Dict[str, any]:
     """
@@ -55,6 +86,50 @@ def analyze_political_orientation(article_text: str) -> Dict[str, any]:
             "reasoning": "OpenAI API nie je k dispozícii - analýza nevykonaná"
         }
     
+    article_text = _truncate_for_analysis(article_text)
+
+    try:
+        # A fresh copy per call, so callers can modify the result without touching the cache.
+        return dict(_cached_analysis(article_text))
+    except Exception as e:
+        error_msg = f"Chyba pri analýze: {str(e)[:100]}"
+        logging.error(f"Error analyzing political orientation: {str(e)}")
+        return {
+            "orientation": "neutral",
+            "confidence": 0.0,
+            "reasoning": error_msg
+        }
+
+
+@lru_cache(maxsize=None)
+def _token_encoding():
+    """
+    Tokenizer for the analysis cap, loaded on the first over-long article rather than at import.
+    tiktoken keeps one instance per encoding, so this is the cl100k_base vectorstore already
+    loaded. A failed load raises and is retried on the next call.
+    """
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _truncate_for_analysis(article_text: str) -> str:
+    """Cut the article to MAX_ANALYSIS_TOKENS, or MAX_ANALYSIS_CHARS if the tokenizer is unavailable."""
+    # Every token is at least one character, so shorter texts need no encoding.
+    if len(article_text) <= MAX_ANALYSIS_TOKENS:
+        return article_text
+    try:
+        encoding = _token_encoding()
+    except Exception as exc:
+        logging.warning(f"Tokenizer unavailable for political analysis, capping by characters: {exc}")
+        return article_text[:MAX_ANALYSIS_CHARS]
+    tokens = encoding.encode(article_text, disallowed_special=())
+    if len(tokens) <= MAX_ANALYSIS_TOKENS:
+        return article_text
+    return encoding.decode(tokens[:MAX_ANALYSIS_TOKENS])
+
+
+@lru_cache(maxsize=256)
+def _cached_analysis(article_text: str) -> Dict[str, any]:
+    """Analysis for an exact article text, cached per process; failed calls raise and are not cached."""
     system_message = """Si expertný politický analytik, ktorý dokáže objektívne analyzovať politickú orientáciu článkov.
 
                         ÚLOHA: Analyzuj politickú orientáciu nasledujúceho článku a klasifikuj ju ako:
@@ -87,51 +162,49 @@ def analyze_political_orientation(article_text: str) -> Dict[str, any]:
                         - "reasoning": konkrétne zdôvodnenie (max 150 znakov, napíš prečo si sa rozhodol tak ako si sa rozhodol)
                         """
 
-    try:
-        response = client.beta.chat.completions.parse(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_message}
-            ],
-            temperature=0.1,
-            response_format=PoliticalOrientationResponse
-        )
-        
-        result = response.choices[0].message.parsed.model_dump()
-        
-        # Validate orientation value
-        if result["orientation"] not in ["left", "right", "neutral"]:
-            logging.warning(f"Invalid orientation returned: {result['orientation']}, defaulting to neutral")
-            result["orientation"] = "neutral"
-            result["reasoning"] = f"Neplatná orientácia '{result['orientation']}', nastavené na neutrálne"
-        
-        # Ensure confidence is between 0 and 1
-        original_confidence = result["confidence"]
-        result["confidence"] = max(0.0, min(1.0, result["confidence"]))
-        
-        # Ensure reasoning is not empty
-        if not result["reasoning"] or result["reasoning"].strip() == "":
-            result["reasoning"] = f"Orientácia: {result['orientation']}, istota: {result['confidence']:.1f}"
-        
-        # Truncate reasoning if too long
-        if len(result["reasoning"]) > 200:
-            result["reasoning"] = result["reasoning"][:197] + "..."
-        
-        if original_confidence != result["confidence"]:
-            logging.warning(f"Confidence adjusted from {original_confidence} to {result['confidence']}")
-        
-        logging.info(f"Political analysis completed: {result['orientation']} (confidence: {result['confidence']:.2f}) - {result['reasoning'][:50]}...")
-        return result
-        
-    except Exception as e:
-        error_msg = f"Chyba pri analýze: {str(e)[:100]}"
-        logging.error(f"Error analyzing political orientation: {str(e)}")
-        return {
-            "orientation": "neutral",
-            "confidence": 0.0,
-            "reasoning": error_msg
-        }
+    response = client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": user_message}
+        ],
+        temperature=0.1,
+        response_format={
+            "type": "json_schema",
+            "json_schema": {
+                "name": "PoliticalOrientation",
+                "schema": POLITICAL_ORIENTATION_SCHEMA,
+                "strict": True,
+            },
+        },
+    )
+    
+    result = orjson.loads(response.choices[0].message.content)
+    
+    # Validate orientation value
+    if result["orientation"] not in ["left", "right", "neutral"]:
+        logging.warning(f"Invalid orientation returned: {result['orientation']}, defaulting to neutral")
+        result["orientation"] = "neutral"
+        result["reasoning"] = f"Neplatná orientácia '{result['orientation']}', nastavené na neutrálne"
+    
+    # Ensure confidence is between 0 and 1
+    original_confidence = result["confidence"]
+    result["confidence"] = max(0.0, min(1.0, float(result["confidence"])))
+    
+    # Ensure reasoning is not empty
+    if not result["reasoning"] or result["reasoning"].strip() == "":
+        result["reasoning"] = f"Orientácia: {result['orientation']}, istota: {result['confidence']:.1f}"
+    
+    # Truncate reasoning if too long
+    if len(result["reasoning"]) > 200:
+        result["reasoning"] = result["reasoning"][:197] + "..."
+    
+    if original_confidence != result["confidence"]:
+        logging.warning(f"Confidence adjusted from {original_confidence} to {result['confidence']}")
+    
+    logging.info(f"Political analysis completed: {result['orientation']} (confidence: {result['confidence']:.2f}) - {result['reasoning'][:50]}...")
+    return result
+
 
 def batch_analyze_political_orientation(articles: list) -> Dict[str, Dict]:
     """
@@ -144,25 +217,27 @@ def batch_analyze_political_orientation(articles: list) -> Dict[str, Dict]:
         Dict mapping URLs to orientation analysis results
     """
     results = {}
-    
-    for article in articles:
-        url = article.get('url')
-        text = article.get('text', '')
-        
-        if not url:
-            continue
-            
+    pending = [(article.get('url'), article.get('text', '')) for article in articles if article.get('url')]
+    if not pending:
+        return results
+
+    def analyze(url: str, text: str) -> Dict[str, any]:
         logging.info(f"Analyzing political orientation for: {url}")
-        
         try:
-            analysis = analyze_political_orientation(text)
-            results[url] = analysis
+            return analyze_political_orientation(text)
         except Exception as e:
             logging.error(f"Failed to analyze {url}: {e}")
-            results[url] = {
+            return {
                 "orientation": "neutral",
                 "confidence": 0.0,
                 "reasoning": f"Analysis failed: {str(e)[:50]}"
             }
-    
-    return results
\ No newline at end of file
+
+    # Each analysis is one blocking API call, so up to BATCH_ANALYSIS_WORKERS run at once.
+    with ThreadPoolExecutor(max_workers=min(BATCH_ANALYSIS_WORKERS, len(pending))) as executor:
+        analyses = executor.map(lambda item: analyze(*item), pending)
+        # map() yields in input order, so a repeated URL keeps its last result as before.
+        for (url, _), analysis in zip(pending, analyses):
+            results[url] = analysis
+
+    return results
@@ -1,11 +1,62 @@
+import re
+import threading
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
-from newspaper import Article
+
+# newspaper3k (which pulls in NLTK and friends) and BeautifulSoup are imported on first use,
+# so importing the scraper package at server start-up does not pay for them.
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    # selectolax is optional; landing pages are then parsed with BeautifulSoup.
+    HTMLParser = None
 
 from .logging_utils import logger
 
+_thread_local = threading.local()
+
+
+def _http_session() -> requests.Session:
+    """
+    Per-thread HTTP session. Each scraper thread works through one landing page and its
+    articles, so keep-alive connections to that site are reused instead of reconnecting per request.
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+
+@lru_cache(maxsize=None)
+def _pattern_regex(patterns: frozenset) -> "re.Pattern[str]":
+    """
+    One compiled alternation per set of substring patterns, so each href is scanned once in C
+    rather than once per pattern. Repeated patterns collapse into a single branch.
+    """
+    if not patterns:
+        # Matches nothing, like any() over no patterns.
+        return re.compile(r"(?!)")
+    return re.compile("|".join(map(re.escape, sorted(patterns))))
+
+
+def _iter_hrefs(html: str):
+    """href values of all <a href> elements, parsed in C by selectolax when it is installed."""
+    if HTMLParser is not None:
+        for a_tag in HTMLParser(html).css("a[href]"):
+            href = a_tag.attributes.get("href")
+            if href is not None:
+                yield href
+        return
+    from bs4 import BeautifulSoup
+
+    for a_tag in BeautifulSoup(html, "html.parser").find_all("a", href=True):
+        yield a_tag["href"]
+
 
 def get_landing_page_links(url, patterns):
     """
@@ -13,26 +64,22 @@ def get_landing_page_links(url, patterns):
     Returns a list of absolute URLs.
     """
     try:
-        response = requests.get(url, timeout=10)
+        response = _http_session().get(url, timeout=10)
         response.raise_for_status()
     except requests.exceptions.RequestException as exc:
         logger.error("Error fetching landing page %s: %s", url, exc)
         return []
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    all_links = []
-
-    # Identify domain for absolute URL creation
-    scheme_and_domain = url.split("//")[0] + "//" + url.split("//")[1].split("/")[0]
-
-    for a_tag in soup.find_all("a", href=True):
-        href = a_tag["href"]
-
-        if any(pattern in href for pattern in patterns):
-            full_url = scheme_and_domain + href if href.startswith("/") else href
-            if full_url not in all_links:
-                all_links.append(full_url)
-
+    pattern_re = _pattern_regex(frozenset(patterns))
+    # dict.fromkeys de-duplicates in O(n) and keeps the first occurrence's position.
+    all_links = list(
+        dict.fromkeys(
+            # Resolves root-relative, relative and protocol-relative hrefs against the page.
+            urljoin(url, href)
+            for href in _iter_hrefs(response.text)
+            if pattern_re.search(href)
+        )
+    )
     logger.info("Found %s potential article links on %s", len(all_links), url)
     return all_links
 
@@ -41,9 +88,21 @@ def parse_article(url):
     """
     Parses a single article using newspaper3k and returns a dict of extracted data.
     """
+    from newspaper import Article, network
+
     try:
         article = Article(url)
-        article.download()
+        config = article.config
+        # Fetched through the pooled session, with newspaper3k's own request options and
+        # decoding, rather than article.download(), which opens a new connection per article.
+        response = _http_session().get(
+            url,
+            **network.get_request_kwargs(
+                config.request_timeout, config.browser_user_agent, config.proxies, config.headers
+            ),
+        )
+        response.raise_for_status()
+        article.download(input_html=network.get_html_2XX_only(url, config, response=response))
         article.parse()
 
         top_image = article.top_image or ""
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from sqlalchemy import text
@@ -24,6 +25,10 @@ PLACEHOLDER_TITLES = {
     "bez názvu",
 }
 
+# Runs the political analysis beside the summary pipeline; one slot per scraper thread
+# (scrape_runner uses at most five), each of which has at most one analysis in flight.
+_analysis_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="PoliticalAnalysis")
+
 
 def _normalize_text(value: str | None) -> str:
     return (value or "").strip()
@@ -87,8 +92,18 @@ def process_new_article(article_data: dict) -> bool:
         log_article_step(article_title, article_url, "Starting article processing")
 
         log_article_step(article_title, article_url, "Analyzing political orientation")
+        # The analysis and the summary pipeline are independent LLM calls, so the analysis
+        # runs on a worker thread while the structured data is generated here.
+        analysis_future = _analysis_executor.submit(analyze_political_orientation, article_text)
+
+        log_article_step(article_title, article_url, "Generating structured article data")
+        llm_data = process_article(
+            article_text,
+            log_step=lambda message: log_article_step(article_title, article_url, message),
+        )
+
         try:
-            political_analysis = analyze_political_orientation(article_text)
+            political_analysis = analysis_future.result()
             log_article_step(
                 article_title,
                 article_url,
@@ -108,11 +123,6 @@ def process_new_article(article_data: dict) -> bool:
                 level=logging.WARNING,
             )
 
-        log_article_step(article_title, article_url, "Generating structured article data")
-        llm_data = process_article(
-            article_text,
-            log_step=lambda message: log_article_step(article_title, article_url, message),
-        )
         article_summary = (llm_data.get("summary", "") or "").strip()
         if not article_summary:
             logger.warning(
@@ -168,16 +178,16 @@ def process_new_article(article_data: dict) -> bool:
                         """
                         SELECT id, title, intro, summary, url
                         FROM articles
-                        WHERE (:article_url <> '' AND :article_url = ANY(url))
-                           OR (:canonical_url <> '' AND :canonical_url = ANY(url))
+                        WHERE url && CAST(:urls AS varchar[])
                         LIMIT 1
                         """
                     ),
-                    {
-                        "article_url": article_url or "",
-                        "canonical_url": canonical_url or "",
-                    },
+                    # Overlap with varchar[] (the column type) is served by the GIN index; empty URLs never match.
+                    {"urls": [url for url in (article_url, canonical_url) if url]},
                 ).fetchone()
+                # End the read transaction so the pooled connection is not held idle in a
+                # transaction during the similarity search and LLM update calls below.
+                session.commit()
 
                 log_article_step(article_title, article_url, "Finding similar article...")
                 if existing_article_row:
@@ -260,11 +270,10 @@ def process_new_article(article_data: dict) -> bool:
                         SET 
                             intro = :intro,
                             summary = :summary,
-                            url = (
-                                SELECT ARRAY(
-                                    SELECT DISTINCT val
-                                    FROM unnest(url || :new_urls) AS val
-                                )
+                            url = ARRAY(
+                                SELECT DISTINCT val
+                                FROM unnest(url || CAST(:new_urls AS varchar[])) AS val
+                                WHERE val <> ''
                             ),
                             scraped_at = :scraped_at
                         WHERE id = :article_id
@@ -123,58 +123,47 @@ def mark_url_as_processed(
             if normalized:
                 urls_to_mark.add(normalized)
 
-        for target_url in urls_to_mark:
-            existing = session.execute(
-                text("SELECT url, orientation, confidence, reasoning FROM processed_urls WHERE url = :url"),
-                {"url": target_url}
-            ).fetchone()
-
-            if existing:
-                existing_confidence = existing[2] or 0.0
-                if confidence > existing_confidence:
-                    logger.info(
-                        "Updating URL with better analysis: %s (confidence: %.2f -> %.2f)",
-                        target_url,
-                        existing_confidence,
-                        confidence,
-                    )
-                    session.execute(
-                        text("""
-                        UPDATE processed_urls 
-                        SET orientation = :orientation,
-                            confidence = :confidence,
-                            reasoning = :reasoning,
-                            scraped_at = CURRENT_TIMESTAMP
-                        WHERE url = :url
-                        """),
-                        {
-                            "url": target_url, 
-                            "orientation": orientation,
-                            "confidence": confidence,
-                            "reasoning": reasoning
-                        }
-                    )
-                else:
-                    logger.info("URL už bolo spracované s rovnakou alebo vyššou istotou: %s", target_url)
-            else:
-                session.execute(
-                    text("""
-                    INSERT INTO processed_urls (url, orientation, confidence, reasoning) 
-                    VALUES (:url, :orientation, :confidence, :reasoning)
-                    """),
-                    {
-                        "url": target_url, 
-                        "orientation": orientation,
-                        "confidence": confidence,
-                        "reasoning": reasoning
-                    }
-                )
+        # One upsert for all URL variants: new URLs are inserted, existing ones are only
+        # overwritten by a more confident analysis. Sorted, so concurrent upserts lock rows
+        # in the same order; xmax = 0 marks a freshly inserted row.
+        rows = session.execute(
+            text("""
+            INSERT INTO processed_urls (url, orientation, confidence, reasoning)
+            SELECT u.url, :orientation, :confidence, :reasoning
+            FROM unnest(CAST(:urls AS text[])) AS u(url)
+            ON CONFLICT (url) DO UPDATE
+            SET orientation = EXCLUDED.orientation,
+                confidence = EXCLUDED.confidence,
+                reasoning = EXCLUDED.reasoning,
+                scraped_at = CURRENT_TIMESTAMP
+            WHERE EXCLUDED.confidence > COALESCE(processed_urls.confidence, 0.0)
+            RETURNING url, (xmax = 0) AS inserted
+            """),
+            {
+                "urls": sorted(urls_to_mark),
+                "orientation": orientation,
+                "confidence": confidence,
+                "reasoning": reasoning
+            }
+        ).fetchall()
+
+        written = {row[0] for row in rows}
+        for target_url, inserted in rows:
+            if inserted:
                 logger.info(
                     "New URL processed: %s - %s (confidence: %.2f)",
                     target_url,
                     orientation,
                     confidence,
                 )
+            else:
+                logger.info(
+                    "Updating URL with better analysis: %s (confidence: %.2f)",
+                    target_url,
+                    confidence,
+                )
+        for target_url in urls_to_mark - written:
+            logger.info("URL už bolo spracované s rovnakou alebo vyššou istotou: %s", target_url)
 
         session.commit()
 
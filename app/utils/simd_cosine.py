@@ -0,0 +1,42 @@
+"""Batched cosine similarity JIT-compiled with Numba, for deployments without SimSIMD."""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional; cosine_rows is then None and callers stay on NumPy.
+    njit = None
+
+
+if njit is not None:
+
+    # Reassociation lets LLVM vectorise the reductions; NaN/inf handling is left intact so
+    # zero-length rows still come out as NaN.
+    @njit(parallel=True, fastmath={"reassoc", "contract", "arcp", "nsz"}, cache=True)
+    def _cosine_rows(matrix: np.ndarray, query: np.ndarray, out: np.ndarray) -> None:
+        n, d = matrix.shape
+        qn = 0.0
+        for j in range(d):
+            qn += query[j] * query[j]
+        qn = qn ** 0.5
+        # Explicit loops instead of np.dot: one pass computes both the dot product and the row norm.
+        for i in prange(n):
+            dot = 0.0
+            mn = 0.0
+            for j in range(d):
+                dot += matrix[i, j] * query[j]
+                mn += matrix[i, j] * matrix[i, j]
+            out[i] = dot / (mn ** 0.5 * qn)
+
+    def cosine_rows(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Cosine similarity of `query` against every row of the (n, d) float32 `matrix`."""
+        out = np.empty(matrix.shape[0], dtype=np.float32)
+        _cosine_rows(np.ascontiguousarray(matrix), np.ascontiguousarray(query), out)
+        return out
+
+else:
+    cosine_rows = None
+
+
+__all__ = ["cosine_rows"]
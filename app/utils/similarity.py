@@ -9,7 +9,7 @@ import numpy as np
 from sqlalchemy import text
 
 from data.db import SessionLocal
-from app.utils.vectorstore import get_embedding
+from app.utils.vectorstore import decode_embedding, get_embeddings
 
 
 TOKEN_PATTERN = re.compile(r"\b[\w][\w'-]*\b", flags=re.UNICODE)
@@ -216,7 +216,13 @@ def find_similar_article(
         - candidate_id: id of closest article even if below threshold
     """
 
-    summary_embedding_raw = get_embedding(article_summary)
+    # Summary and body are embedded in one batched request.
+    texts = [article_summary]
+    if article_text:
+        texts.append(article_text[:ARTICLE_TEXT_EMBED_LIMIT])
+    embeddings = get_embeddings(texts)
+    summary_embedding_raw = embeddings[0]
+    body_embedding_raw = embeddings[1] if len(embeddings) > 1 else None
     if summary_embedding_raw is None:
         logging.warning("Failed to obtain embedding for new article summary")
         return {"article": None, "score": 0.0, "candidate_title": None, "candidate_id": None}
@@ -224,11 +230,8 @@ def find_similar_article(
     summary_embedding = np.array(summary_embedding_raw, dtype=np.float32)
 
     body_embedding = None
-    if article_text:
-        truncated_text = article_text[:ARTICLE_TEXT_EMBED_LIMIT]
-        body_embedding_raw = get_embedding(truncated_text)
-        if body_embedding_raw is not None:
-            body_embedding = np.array(body_embedding_raw, dtype=np.float32)
+    if body_embedding_raw is not None:
+        body_embedding = np.array(body_embedding_raw, dtype=np.float32)
 
     keyword_source = article_summary
     if article_text:
@@ -270,7 +273,7 @@ def extracted_articles(
     result = session.execute(
         text(
             """
-            SELECT ae.id, ae.summary, ae.embedding, a.title, a.tags
+            SELECT ae.id, ae.summary, array_send(ae.embedding), a.title, a.tags
             FROM article_embeddings ae
             LEFT JOIN articles a ON a.id = ae.id
             """
@@ -298,11 +301,8 @@ def extracted_articles(
         }
 
     for article_id, summary, stored_embedding, stored_title, stored_tags in stored_articles:
-        if not stored_embedding:
-            continue
-
-        stored_embedding = np.array(stored_embedding, dtype=np.float32)
-        if stored_embedding.size == 0:
+        stored_embedding = decode_embedding(stored_embedding)
+        if stored_embedding is None or stored_embedding.size == 0:
             continue
 
         stored_norm = np.linalg.norm(stored_embedding)
@@ -455,7 +455,7 @@ def semantic_query_search(
         SELECT 
             a.id, a.title, a.intro, a.summary, a.url, a.category, a.tags, a.top_image, a.scraped_at,
             a.fact_check_results, a.summary_annotations,
-            ae.embedding
+            array_send(ae.embedding)
         FROM articles a
         INNER JOIN article_embeddings ae ON a.id = ae.id
         WHERE ae.embedding IS NOT NULL
@@ -465,12 +465,8 @@ def semantic_query_search(
     candidates: list[dict] = []
 
     for row in result:
-        stored_embedding = row[11]
-        if not stored_embedding:
-            continue
-
-        stored_vector = np.array(stored_embedding, dtype=np.float32)
-        if stored_vector.size == 0:
+        stored_vector = decode_embedding(row[11])
+        if stored_vector is None or stored_vector.size == 0:
             continue
 
         stored_norm = np.linalg.norm(stored_vector)
@@ -526,7 +522,9 @@ def semantic_query_search(
                     "tokens": round(token_overlap, 4),
                     "combined": round(combined_score, 4),
                 },
-                "data": _row_to_article_dict(row),
+                # Converted with _row_to_article_dict only if selected below; the slice
+                # drops the embedding bytes so they are not kept for every candidate.
+                "row": row[:11],
             }
         )
 
@@ -535,23 +533,22 @@ def semantic_query_search(
 
     candidates.sort(key=lambda item: item["metrics"]["combined"], reverse=True)
 
-    selected = [
-        {
-            **candidate["data"],
-            "match_score": candidate["metrics"]["combined"],
-        }
+    chosen = [
+        candidate
         for candidate in candidates
         if candidate["metrics"]["combined"] >= QUERY_COMBINED_THRESHOLD
     ][:limit]
 
-    if not selected:
-        selected = [
-            {
-                **candidate["data"],
-                "match_score": candidate["metrics"]["combined"],
-            }
-            for candidate in candidates[:limit]
-        ]
+    if not chosen:
+        chosen = candidates[:limit]
+
+    selected = [
+        {
+            **_row_to_article_dict(candidate["row"]),
+            "match_score": candidate["metrics"]["combined"],
+        }
+        for candidate in chosen
+    ]
 
     logging.info(
         "Semantic query search evaluated %s candidates; returning %s results.",
@@ -1,31 +1,36 @@
 import logging
 import os
+import struct
 
 import numpy as np
 import tiktoken
 from dotenv import load_dotenv
-from openai import OpenAI
+from psycopg2.extras import execute_values
 from sqlalchemy import text as tx
 
 from data.db import SessionLocal
+from app.utils.openai_client import get_client
 
 load_dotenv()
 
-if api_key := os.getenv("OPENAI_API_KEY"):
-    client = OpenAI(api_key=api_key)
-else:
+client = get_client()
+if client is None:
     raise ValueError("Missing OPENAI_API_KEY. Ensure it's set in .env or environment variables.")
 
 EMBEDDING_MODEL = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-ada-002")
 MAX_TOKENS_PER_CHUNK = int(os.getenv("EMBEDDING_MAX_TOKENS", "7500"))
 CHUNK_OVERLAP_TOKENS = int(os.getenv("EMBEDDING_CHUNK_OVERLAP", "200"))
+# Inputs sent per embeddings request; the endpoint also caps the total tokens of one request.
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "96"))
+MAX_TOKENS_PER_REQUEST = int(os.getenv("EMBEDDING_MAX_TOKENS_PER_REQUEST", "250000"))
 _encoding = tiktoken.get_encoding("cl100k_base")
 
 
-def _chunk_text(text: str) -> list[str]:
+def _chunk_text(text: str) -> list[tuple[str, int]]:
+    """Split text into overlapping chunks, returned as (chunk, token count) pairs."""
     tokens = _encoding.encode(text)
     if len(tokens) <= MAX_TOKENS_PER_CHUNK:
-        return [text]
+        return [(text, len(tokens))]
 
     chunks = []
     start = 0
@@ -34,7 +39,7 @@ def _chunk_text(text: str) -> list[str]:
     while start < len(tokens):
         end = min(len(tokens), start + MAX_TOKENS_PER_CHUNK)
         chunk_tokens = tokens[start:end]
-        chunks.append(_encoding.decode(chunk_tokens))
+        chunks.append((_encoding.decode(chunk_tokens), len(chunk_tokens)))
         if end == len(tokens):
             break
         start += step
@@ -42,46 +47,107 @@ def _chunk_text(text: str) -> list[str]:
     return chunks
 
 
-def get_embedding(text: str):
-    if not text:
+def _request_batches(chunks: list[tuple[str, int]]):
+    """Group chunks into requests bounded by EMBEDDING_BATCH_SIZE inputs and MAX_TOKENS_PER_REQUEST tokens."""
+    batch: list[str] = []
+    batch_tokens = 0
+    for chunk, token_count in chunks:
+        if batch and (len(batch) >= EMBEDDING_BATCH_SIZE or batch_tokens + token_count > MAX_TOKENS_PER_REQUEST):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(chunk)
+        batch_tokens += token_count
+    if batch:
+        yield batch
+
+
+def get_embeddings(texts: list[str]) -> list:
+    """
+    Embed several texts with as few requests as possible. Long texts are chunked and their
+    chunk embeddings average-pooled; the result keeps the order of `texts`, with None for
+    empty texts or when the request fails.
+    """
+    chunked = [_chunk_text(text) if text else [] for text in texts]
+    flat_chunks = [chunk for chunks in chunked for chunk in chunks]
+    if not all(texts):
         logging.warning("Empty text supplied for embedding; returning None.")
-        return None
+    if not flat_chunks:
+        return [None] * len(texts)
 
     try:
-        chunks = _chunk_text(text)
-        embeddings = []
-
-        for chunk in chunks:
-            response = client.embeddings.create(
-                model=EMBEDDING_MODEL,
-                input=chunk
-            )
-            embeddings.append(np.array(response.data[0].embedding, dtype=np.float32))
-
-        if not embeddings:
-            logging.error("No embeddings returned from OpenAI.")
-            return None
-
-        if len(embeddings) == 1:
-            return embeddings[0].tolist()
-
-        # Average pool chunk embeddings to a single vector
-        aggregated = np.mean(np.stack(embeddings), axis=0)
-        return aggregated.tolist()
+        vectors = []
+        for batch in _request_batches(flat_chunks):
+            response = client.embeddings.create(model=EMBEDDING_MODEL, input=batch)
+            data = sorted(response.data, key=lambda item: item.index)
+            vectors.extend(np.array(item.embedding, dtype=np.float32) for item in data)
     except Exception as e:
         logging.error(f"Failed to fetch embedding from OpenAI: {e}")
+        return [None] * len(texts)
+
+    if len(vectors) != len(flat_chunks):
+        logging.error("No embeddings returned from OpenAI.")
+        return [None] * len(texts)
+
+    results = []
+    position = 0
+    for chunks in chunked:
+        if not chunks:
+            results.append(None)
+            continue
+        text_vectors = vectors[position:position + len(chunks)]
+        position += len(chunks)
+        if len(text_vectors) == 1:
+            results.append(text_vectors[0].tolist())
+        else:
+            # Average pool chunk embeddings to a single vector
+            results.append(np.mean(np.stack(text_vectors), axis=0).tolist())
+    return results
+
+
+def get_embedding(text: str):
+    return get_embeddings([text])[0]
+
+
+def _normalised(emb) -> list:
+    # Stored L2-normalised, so cosine similarity against stored rows is a plain dot product.
+    emb_np = np.array(emb, dtype=np.float32)
+    norm = np.linalg.norm(emb_np)
+    if norm > 0:
+        emb_np /= norm
+    return emb_np.tolist()  # Convert NumPy array to list
+
+
+# Element layout of PostgreSQL's binary array format (array_send): a length word, then the float4.
+_ARRAY_SEND_ITEM = np.dtype([("length", ">i4"), ("value", ">f4")])
+_FLOAT4_OID = 700
+
+
+def decode_embedding(data):
+    """
+    Decode `array_send(embedding)` bytes into a float32 vector. Selecting the binary form keeps
+    the REAL[] column off the text wire format and avoids building a Python float per element.
+    Returns None for empty, multi-dimensional or NULL-containing arrays.
+    """
+    if not data:
+        return None
+    ndim, has_nulls, element_oid = struct.unpack_from(">iiI", data)
+    if ndim != 1 or has_nulls or element_oid != _FLOAT4_OID:
         return None
+    (dimension,) = struct.unpack_from(">i", data, 12)
+    items = np.frombuffer(data, dtype=_ARRAY_SEND_ITEM, count=dimension, offset=20)
+    return items["value"].astype(np.float32)
+
 
-def store_embedding(article_id, text):
-    """Generates and stores an embedding in PostgreSQL (pgvector)."""
+def store_embedding(article_id, text, embedding=None):
+    """Generates (unless `embedding` is supplied) and stores an embedding in PostgreSQL (pgvector)."""
     session = SessionLocal()
-    emb = get_embedding(text)
+    emb = embedding if embedding is not None else get_embedding(text)
     
     if emb is None:
         logging.warning(f"Skipping embedding for article {article_id} due to error.")
         return
 
-    emb_np = np.array(emb, dtype=np.float32).tolist()  # Convert NumPy array to list
+    emb_np = _normalised(emb)
 
     session.execute(
         tx("INSERT INTO article_embeddings (id, embedding, summary) VALUES (:id, :embedding, :summary) "
@@ -96,3 +162,40 @@ def store_embedding(article_id, text):
     session.commit()
     session.close()
     logging.info(f"Stored embedding for article {article_id}.")
+
+
+def store_embeddings_bulk(items, page_size: int = 1000) -> int:
+    """
+    Embed and store many (article_id, text) pairs: embeddings come from batched requests and
+    rows are written with a single multi-row INSERT per page. Returns the number of rows stored.
+    """
+    items = list(items)
+    embeddings = get_embeddings([text for _, text in items])
+
+    rows = []
+    for (article_id, text), emb in zip(items, embeddings):
+        if emb is None:
+            logging.warning(f"Skipping embedding for article {article_id} due to error.")
+            continue
+        rows.append((str(article_id), _normalised(emb), text))
+
+    if not rows:
+        return 0
+
+    session = SessionLocal()
+    try:
+        # execute_values needs the DB-API cursor underneath the session's connection.
+        cursor = session.connection().connection.cursor()
+        execute_values(
+            cursor,
+            "INSERT INTO article_embeddings (id, embedding, summary) VALUES %s "
+            "ON CONFLICT (id) DO UPDATE SET embedding = EXCLUDED.embedding",
+            rows,
+            page_size=page_size,
+        )
+        session.commit()
+    finally:
+        session.close()
+
+    logging.info(f"Stored {len(rows)} embeddings.")
+    return len(rows)
@@ -0,0 +1,26 @@
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+DB_URL = os.getenv("DATABASE_URL")
+
+
+def add_articles_url_gin_index(engine):
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    sql_file_path = os.path.join(current_dir, "migrations", "add_articles_url_gin_index.sql")
+
+    with open(sql_file_path, "r", encoding="utf-8") as sql_file:
+        sql = sql_file.read()
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(sql))
+
+
+if __name__ == "__main__":
+    if not DB_URL:
+        raise RuntimeError("DATABASE_URL is not set.")
+    engine = create_engine(DB_URL)
+    add_articles_url_gin_index(engine)
+    print("Articles url GIN index ensured.")
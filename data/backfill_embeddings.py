@@ -0,0 +1,34 @@
+"""Embed every article that has a summary but no stored embedding (run as `python -m data.backfill_embeddings`)."""
+from sqlalchemy import create_engine, text
+from dotenv import load_dotenv
+import os
+
+load_dotenv()
+DB_URL = os.getenv("DATABASE_URL")
+
+BATCH_SIZE = 500
+
+
+def backfill_embeddings(engine):
+    from app.utils.vectorstore import store_embeddings_bulk
+
+    with engine.connect() as connection:
+        rows = connection.execute(text("""
+            SELECT a.id, a.summary
+            FROM articles a
+            LEFT JOIN article_embeddings ae ON ae.id = a.id
+            WHERE ae.id IS NULL AND COALESCE(a.summary, '') <> ''
+        """)).fetchall()
+
+    stored = 0
+    for start in range(0, len(rows), BATCH_SIZE):
+        stored += store_embeddings_bulk([(row[0], row[1]) for row in rows[start:start + BATCH_SIZE]])
+    return stored
+
+
+if __name__ == "__main__":
+    if not DB_URL:
+        raise RuntimeError("DATABASE_URL is not set.")
+    engine = create_engine(DB_URL)
+    stored = backfill_embeddings(engine)
+    print(f"Stored {stored} missing article embeddings.")
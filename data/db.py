@@ -1,5 +1,6 @@
 import os
 
+import orjson
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -49,6 +50,8 @@ engine = create_engine(
     pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
     max_overflow=int(os.getenv("DB_POOL_MAX_OVERFLOW", "5")),
     connect_args=_get_connect_args(DB_URL),
+    # psycopg2 decodes JSON/JSONB columns with this instead of the stdlib json module.
+    json_deserializer=orjson.loads,
 )
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
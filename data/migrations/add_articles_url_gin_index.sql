@@ -0,0 +1,4 @@
+-- GIN index over the articles.url array, so URL lookups written as `url @> ARRAY[...]`
+-- (scraping_service._resolve_article_ids_by_urls) become index scans instead of full scans.
+-- CONCURRENTLY avoids blocking writes; it must run outside a transaction, as a single statement.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_url_gin ON articles USING gin (url);
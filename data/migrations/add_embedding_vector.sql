@@ -0,0 +1,13 @@
+-- pgvector copy of article_embeddings.embedding (REAL[]), so similarity ranking runs inside Postgres.
+-- The REAL[] column stays the source of truth; the vector column is derived from it on every write.
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- 1536 = text-embedding-ada-002; rows with any other length (or no embedding) are left NULL
+-- instead of failing the insert.
+ALTER TABLE article_embeddings
+ADD COLUMN IF NOT EXISTS embedding_vec vector(1536) GENERATED ALWAYS AS (
+    CASE WHEN cardinality(embedding) = 1536 THEN embedding::vector(1536) END
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_article_embeddings_embedding_vec_hnsw ON article_embeddings
+USING hnsw (embedding_vec vector_cosine_ops);
@@ -0,0 +1,21 @@
+-- Full-text search vector over the columns search_service.search_articles matches on
+-- (title, summary, intro, category, tags), weighted by where the match occurs.
+-- array_to_string() is only STABLE; generated columns need an IMMUTABLE wrapper (safe for text[]).
+CREATE OR REPLACE FUNCTION immutable_array_to_string(value TEXT[], separator TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE PARALLEL SAFE STRICT
+AS $$
+    SELECT array_to_string(value, separator)
+$$;
+
+ALTER TABLE articles
+ADD COLUMN IF NOT EXISTS search_vec TSVECTOR GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', COALESCE(title, '')), 'A')
+    || setweight(to_tsvector('simple', COALESCE(summary, '')), 'B')
+    || setweight(to_tsvector('simple', COALESCE(intro, '')), 'B')
+    || setweight(to_tsvector('simple', COALESCE(category, '')), 'C')
+    || setweight(to_tsvector('simple', COALESCE(immutable_array_to_string(tags, ' '), '')), 'C')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_articles_search_vec ON articles USING gin (search_vec);
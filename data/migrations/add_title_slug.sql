@@ -0,0 +1,32 @@
+-- Indexed slug of the article title, approximating article_service._normalise_slug(_title_to_slug(title)):
+-- drop '.' and ',', trim, spaces -> '-', lowercase, strip diacritics, keep only [a-z0-9-].
+-- unaccent() transliterates some characters Python drops ('–' -> '-', 'ß' -> 'ss'), so the slugs can
+-- differ; article_service falls back to scanning recent titles when the indexed lookup misses.
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- unaccent() is only STABLE; generated columns need an IMMUTABLE wrapper with a fixed dictionary.
+CREATE OR REPLACE FUNCTION immutable_unaccent(value TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE PARALLEL SAFE STRICT
+AS $$
+    SELECT public.unaccent('public.unaccent'::regdictionary, value)
+$$;
+
+ALTER TABLE articles
+ADD COLUMN IF NOT EXISTS title_slug TEXT GENERATED ALWAYS AS (
+    regexp_replace(
+        immutable_unaccent(
+            lower(replace(btrim(regexp_replace(COALESCE(title, ''), '[.,]', '', 'g'), E' \t\n\r'), ' ', '-'))
+        ),
+        '[^a-z0-9-]', '', 'g'
+    )
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_articles_title_slug ON articles (title_slug);
+
+-- Trigram index so the '%word%word%' LIKE lookup on the raw-title slug expression can use an index scan.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_articles_title_slug_expr_trgm ON articles
+USING gin (LOWER(REPLACE(REPLACE(REPLACE(title, ' ', '-'), '.', ''), ',', '')) gin_trgm_ops);
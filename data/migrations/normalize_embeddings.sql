@@ -0,0 +1,21 @@
+-- L2-normalise stored embeddings once; vectorstore.store_embedding normalises new ones on insert.
+-- With unit-length rows, cosine similarity against them reduces to a dot product.
+-- Re-running is harmless: unit vectors stay (numerically) unchanged.
+UPDATE article_embeddings AS ae
+SET embedding = normalised.embedding
+FROM (
+    SELECT
+        e.id,
+        ARRAY(
+            SELECT u.value / norms.norm
+            FROM unnest(e.embedding) WITH ORDINALITY AS u(value, position)
+            ORDER BY u.position
+        )::REAL[] AS embedding
+    FROM article_embeddings e
+    CROSS JOIN LATERAL (
+        SELECT sqrt(sum(value * value)) AS norm
+        FROM unnest(e.embedding) AS value
+    ) AS norms
+    WHERE e.embedding IS NOT NULL AND norms.norm > 0
+) AS normalised
+WHERE ae.id = normalised.id;